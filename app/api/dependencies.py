@@ -1,26 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from datetime import timezone
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from qdrant_client import QdrantClient
 from sqlalchemy.orm import Session
 
-from app.config import Settings, get_settings
+from app.config import get_settings
 from app.core.embedding_service import EmbeddingService
 from app.core.llm_service import LLMService
 from app.core.prompt_manager import PromptManager
 from app.core.document_ingestor import DocumentIngestor
+from app.core.hybrid_retrieval import HybridRetriever
 from app.core.rag_pipeline import RAGPipeline
 from app.db.database import get_db
-from app.db.models import User
-from app.models.auth import UserRole
+from app.models.auth import ROLE_BY_VALUE, AuthenticatedUser, UserRole
 from app.observability.observability_manager import ObservabilityManager
 from app.security.auth_manager import AuthManager
 from app.security.security_manager import SecurityManager
 
+logger = logging.getLogger(__name__)
+
 bearer_scheme = HTTPBearer(auto_error=False)
 
 # ---- Singletons (lazily initialized) ----
+# Dependencies that only hand out cached objects are ``async def`` so FastAPI
+# calls them on the event loop instead of hopping to the threadpool. Settings
+# are read through the lru_cached get_settings() rather than a Depends node,
+# since a sync dependency would itself be dispatched to the threadpool.
+# dep_document_ingestor stays sync because its constructor talks to Qdrant,
+# and stays per-request so a recreated collection is picked up again; it is
+# handed the shared retriever's BM25 index so ingests and deletes keep it live.
+#
+# Getters whose constructor never awaits are atomic on the event loop. The
+# embedding model, Qdrant client and hybrid retriever are built in the
+# threadpool, so those use a double-checked lock to stop concurrent first requests from each
+# constructing one. warm_up_singletons() builds them at startup.
 
 _embedding_service: EmbeddingService | None = None
 _llm_service: LLMService | None = None
@@ -28,26 +51,31 @@ _prompt_manager: PromptManager | None = None
 _qdrant_client: QdrantClient | None = None
 _obs_manager: ObservabilityManager | None = None
 _security_manager: SecurityManager | None = None
+_rag_pipeline: RAGPipeline | None = None
+_hybrid_retriever: HybridRetriever | None = None
 
-
-def dep_settings() -> Settings:
-    return get_settings()
+_embedding_lock = asyncio.Lock()
+_qdrant_lock = asyncio.Lock()
+_hybrid_retriever_lock = asyncio.Lock()
 
 
-def dep_db(db: Session = Depends(get_db)) -> Session:
+async def dep_db(db: Session = Depends(get_db)) -> Session:
     return db
 
 
-def dep_embedding_service(settings: Settings = Depends(dep_settings)) -> EmbeddingService:
+async def dep_embedding_service() -> EmbeddingService:
     global _embedding_service
     if _embedding_service is None:
-        _embedding_service = EmbeddingService(settings.embedding_model)
+        async with _embedding_lock:
+            if _embedding_service is None:
+                _embedding_service = await run_in_threadpool(EmbeddingService, get_settings().embedding_model)
     return _embedding_service
 
 
-def dep_llm_service(settings: Settings = Depends(dep_settings)) -> LLMService:
+async def dep_llm_service() -> LLMService:
     global _llm_service
     if _llm_service is None:
+        settings = get_settings()
         _llm_service = LLMService(
             api_key=settings.deepseek_api_key,
             base_url=settings.deepseek_base_url,
@@ -56,64 +84,143 @@ def dep_llm_service(settings: Settings = Depends(dep_settings)) -> LLMService:
     return _llm_service
 
 
-def dep_prompt_manager() -> PromptManager:
+async def dep_prompt_manager() -> PromptManager:
     global _prompt_manager
     if _prompt_manager is None:
         _prompt_manager = PromptManager()
     return _prompt_manager
 
 
-def dep_qdrant_client(settings: Settings = Depends(dep_settings)) -> QdrantClient:
+async def dep_qdrant_client() -> QdrantClient:
     global _qdrant_client
     if _qdrant_client is None:
-        _qdrant_client = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
+        async with _qdrant_lock:
+            if _qdrant_client is None:
+                settings = get_settings()
+                _qdrant_client = await run_in_threadpool(
+                    QdrantClient,
+                    host=settings.qdrant_host,
+                    port=settings.qdrant_port,
+                    grpc_port=settings.qdrant_grpc_port,
+                    prefer_grpc=settings.qdrant_prefer_grpc,
+                )
     return _qdrant_client
 
 
-def dep_observability(settings: Settings = Depends(dep_settings)) -> ObservabilityManager:
+async def warm_up_singletons() -> None:
+    """Build the expensive singletons up front so no request pays for model loading."""
+    await dep_embedding_service()
+    await dep_qdrant_client()
+
+
+async def dep_observability() -> ObservabilityManager:
     global _obs_manager
     if _obs_manager is None:
-        _obs_manager = ObservabilityManager(settings)
+        _obs_manager = ObservabilityManager(get_settings())
     return _obs_manager
 
 
-def dep_security_manager() -> SecurityManager:
+async def dep_security_manager() -> SecurityManager:
     global _security_manager
     if _security_manager is None:
         _security_manager = SecurityManager()
     return _security_manager
 
 
-def dep_auth_manager(db: Session = Depends(dep_db), settings: Settings = Depends(dep_settings)) -> AuthManager:
-    return AuthManager(db, settings)
+async def dep_auth_manager(db: Session = Depends(dep_db)) -> AuthManager:
+    return AuthManager(db, get_settings())
+
+
+async def dep_hybrid_retriever(
+    embedding: EmbeddingService = Depends(dep_embedding_service),
+    qdrant: QdrantClient = Depends(dep_qdrant_client),
+) -> HybridRetriever:
+    # Built in the threadpool: the constructor loads the persisted BM25 index
+    global _hybrid_retriever
+    if _hybrid_retriever is None:
+        async with _hybrid_retriever_lock:
+            if _hybrid_retriever is None:
+                _hybrid_retriever = await run_in_threadpool(
+                    HybridRetriever,
+                    embedding_service=embedding,
+                    qdrant_client=qdrant,
+                    collection_name=get_settings().qdrant_collection,
+                )
+    return _hybrid_retriever
 
 
 def dep_document_ingestor(
     embedding: EmbeddingService = Depends(dep_embedding_service),
     qdrant: QdrantClient = Depends(dep_qdrant_client),
-    settings: Settings = Depends(dep_settings),
+    retriever: HybridRetriever = Depends(dep_hybrid_retriever),
 ) -> DocumentIngestor:
     return DocumentIngestor(
         embedding_service=embedding,
         qdrant_client=qdrant,
-        collection_name=settings.qdrant_collection,
+        collection_name=get_settings().qdrant_collection,
+        keyword_index=retriever.keyword_index,
     )
 
 
-def dep_rag_pipeline(
+async def dep_rag_pipeline(
     embedding: EmbeddingService = Depends(dep_embedding_service),
     llm: LLMService = Depends(dep_llm_service),
     prompt: PromptManager = Depends(dep_prompt_manager),
     qdrant: QdrantClient = Depends(dep_qdrant_client),
-    settings: Settings = Depends(dep_settings),
 ) -> RAGPipeline:
-    return RAGPipeline(
-        embedding_service=embedding,
-        llm_service=llm,
-        prompt_manager=prompt,
-        qdrant_client=qdrant,
-        collection_name=settings.qdrant_collection,
-    )
+    # Shared across requests: the pipeline only holds references to the
+    # singletons above and keeps no per-request state.
+    global _rag_pipeline
+    if _rag_pipeline is None:
+        _rag_pipeline = RAGPipeline(
+            embedding_service=embedding,
+            llm_service=llm,
+            prompt_manager=prompt,
+            qdrant_client=qdrant,
+            collection_name=get_settings().qdrant_collection,
+        )
+    return _rag_pipeline
+
+
+# ---- Auth verification caches ----
+# Entries map a 128-bit credential digest to (value, expires_at); the raw
+# token/key is never stored. JWT entries hold the user_id and the user row is
+# still loaded per request. API-key entries hold (user_id, role) from the
+# joined key/user lookup, which only matches active users, so a hit needs no
+# query; clear_api_key_cache() drops them when a key, role or user changes.
+
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+_apikey_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_auth_cache_lock = threading.Lock()
+
+
+def _credential_key(raw: str) -> bytes:
+    # Only a lookup key: hits are populated after full verification, so a
+    # fast non-truncated 128-bit BLAKE2b digest is sufficient.
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+def _cache_get(cache: TTLCache, key: bytes):
+    with _auth_cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del cache[key]
+            return None
+        return value
+
+
+def _cache_put(cache: TTLCache, key: bytes, value, expires_at: float | None = None) -> None:
+    with _auth_cache_lock:
+        cache[key] = (value, expires_at)
+
+
+def clear_api_key_cache() -> None:
+    """Drop cached API-key verifications, e.g. after a key is revoked or a user's role changes."""
+    with _auth_cache_lock:
+        _apikey_cache.clear()
 
 
 # ---- Auth dependencies ----
@@ -121,52 +228,62 @@ def dep_rag_pipeline(
 async def dep_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    db: Session = Depends(dep_db),
-    settings: Settings = Depends(dep_settings),
-) -> User:
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    auth_mgr = AuthManager(db, settings)
-
+    auth_mgr: AuthManager = Depends(dep_auth_manager),
+) -> AuthenticatedUser:
     # Try JWT bearer token
     if credentials:
-        logger.info("Attempting JWT auth with token: %s...", credentials.credentials[:20])
-        payload = auth_mgr.verify_token(credentials.credentials)
-        if payload:
-            user_id = int(payload.sub)
-            logger.info("JWT valid, user_id: %s", user_id)
+        cache_key = _credential_key(credentials.credentials)
+        user_id = _cache_get(_jwt_cache, cache_key)
+        if user_id is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Attempting JWT auth for token fingerprint %s", cache_key.hex())
+            payload = auth_mgr.verify_token(credentials.credentials)
+            if payload:
+                user_id = int(payload.sub)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("JWT valid, user_id: %s", user_id)
+                _cache_put(_jwt_cache, cache_key, user_id, payload.exp.timestamp())
+            else:
+                logger.warning("JWT verification failed")
+        if user_id is not None:
             user = auth_mgr.get_user_by_id(user_id)
             if user and user.is_active:
                 request.state.user_id = user.id
-                return user
+                return AuthenticatedUser(user.id, ROLE_BY_VALUE[user.role])
             else:
                 logger.warning("User not found or inactive: %s", user_id)
-        else:
-            logger.warning("JWT verification failed")
 
     # Try API key from header
     api_key = request.headers.get("X-API-Key")
     if api_key:
-        key_payload = auth_mgr.verify_api_key(api_key)
-        if key_payload:
-            user = auth_mgr.get_user_by_id(key_payload.user_id)
-            if user and user.is_active:
-                request.state.user_id = user.id
-                return user
+        cache_key = _credential_key(api_key)
+        identity = _cache_get(_apikey_cache, cache_key)
+        if identity is None:
+            key_payload = auth_mgr.verify_api_key(api_key)
+            if key_payload:
+                identity = (key_payload.user_id, key_payload.role)
+                expires_at = key_payload.expires_at
+                _cache_put(
+                    _apikey_cache,
+                    cache_key,
+                    identity,
+                    expires_at.replace(tzinfo=timezone.utc).timestamp() if expires_at else None,
+                )
+        if identity is not None:
+            user_id, role = identity
+            request.state.user_id = user_id
+            return AuthenticatedUser(user_id, role)
 
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or missing credentials")
 
 
 def require_roles(*roles: UserRole):
     """Factory that returns a dependency checking the current user has one of the given roles."""
+    # UserRole is a str enum, so this set matches both members and raw column values.
+    allowed = frozenset(roles)
 
-    async def _check(
-        current_user: User = Depends(dep_current_user),
-        sec: SecurityManager = Depends(dep_security_manager),
-    ) -> User:
-        user_role = UserRole(current_user.role)
-        if not sec.has_any_role(user_role, list(roles)):
+    async def _check(current_user: AuthenticatedUser = Depends(dep_current_user)) -> AuthenticatedUser:
+        if current_user.role not in allowed:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
         return current_user
 
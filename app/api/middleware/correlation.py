@@ -1,21 +0,0 @@
-from __future__ import annotations
-
-import uuid
-
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-
-CORRELATION_HEADER = "X-Correlation-ID"
-
-
-class CorrelationMiddleware(BaseHTTPMiddleware):
-    """Injects a correlation ID into every request/response cycle."""
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        correlation_id = request.headers.get(CORRELATION_HEADER) or str(uuid.uuid4())
-        request.state.correlation_id = correlation_id
-
-        response = await call_next(request)
-        response.headers[CORRELATION_HEADER] = correlation_id
-        return response
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.observability.observability_manager import ObservabilityManager
+
+CORRELATION_HEADER = "X-Correlation-ID"
+
+# Probe and API-doc paths that need no correlation ID or request logging.
+SKIP_PATHS: frozenset[str] = frozenset({"/health", "/openapi.json", "/docs", "/redoc"})
+
+
+class ObservabilityMiddleware:
+    """Injects a correlation ID and logs every HTTP request/response with latency.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware so it adds no
+    per-request task and leaves streaming responses untouched.
+    """
+
+    def __init__(self, app: ASGIApp, obs: ObservabilityManager):
+        self.app = app
+        self._obs = obs
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = Headers(scope=scope).get(CORRELATION_HEADER) or self._obs.generate_correlation_id()
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = correlation_id
+        method = scope["method"]
+        path = scope["path"]
+
+        self._obs.log_request(method, path, correlation_id, state.get("user_id"))
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_correlation(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(CORRELATION_HEADER, correlation_id)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                self._obs.log_response(
+                    method, path, status_code,
+                    correlation_id, latency_ms, state.get("user_id"),
+                )
+
+        await self.app(scope, receive, send_with_correlation)
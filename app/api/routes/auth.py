@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import dep_auth_manager, dep_current_user, require_roles
-from app.db.models import User
+from app.api.dependencies import clear_api_key_cache, dep_auth_manager, dep_current_user, require_roles
+from app.db.models import APIKey
 from app.models.auth import (
+    ROLE_BY_VALUE,
     APIKeyCreate,
     APIKeyResponse,
+    AuthenticatedUser,
     TokenRequest,
     TokenResponse,
     UserCreate,
@@ -18,11 +21,13 @@ from app.security.auth_manager import AuthManager
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+_API_KEYS_ADAPTER = TypeAdapter(list[APIKeyResponse])
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(
     data: UserCreate,
-    _admin: User = Depends(require_roles(UserRole.ADMIN)),
+    _admin: AuthenticatedUser = Depends(require_roles(UserRole.ADMIN)),
     auth: AuthManager = Depends(dep_auth_manager),
 ):
     existing = auth._user_repo.get_by_email(data.email)
@@ -37,7 +42,7 @@ def login(data: TokenRequest, auth: AuthManager = Depends(dep_auth_manager)):
     user = auth.authenticate_user(data.email, data.password)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    token = auth.create_access_token(user.id, UserRole(user.role))
+    token = auth.create_access_token(user.id, ROLE_BY_VALUE[user.role])
     return TokenResponse(
         access_token=token,
         expires_in=auth._settings.jwt_expiry_minutes * 60,
@@ -47,7 +52,7 @@ def login(data: TokenRequest, auth: AuthManager = Depends(dep_auth_manager)):
 @router.post("/api-keys", response_model=dict)
 def create_api_key(
     data: APIKeyCreate,
-    current_user: User = Depends(dep_current_user),
+    current_user: AuthenticatedUser = Depends(dep_current_user),
     auth: AuthManager = Depends(dep_auth_manager),
 ):
     raw_key, api_key = auth.create_api_key(current_user.id, data.name)
@@ -61,28 +66,33 @@ def create_api_key(
 
 
 @router.get("/api-keys", response_model=list[APIKeyResponse])
-def list_api_keys(current_user: User = Depends(dep_current_user), auth: AuthManager = Depends(dep_auth_manager)):
-    from app.db.models import APIKey
-
-    keys = auth._db.query(APIKey).filter(APIKey.user_id == current_user.id, APIKey.is_active == True).all()  # noqa: E712
-    return [APIKeyResponse.model_validate(k) for k in keys]
+def list_api_keys(current_user: AuthenticatedUser = Depends(dep_current_user), auth: AuthManager = Depends(dep_auth_manager)):
+    keys = (
+        auth._db.query(APIKey.id, APIKey.name, APIKey.key_prefix, APIKey.created_at, APIKey.is_active)
+        .filter(APIKey.user_id == current_user.id, APIKey.is_active == True)  # noqa: E712
+        .all()
+    )
+    return _API_KEYS_ADAPTER.validate_python(keys, from_attributes=True)
 
 
 @router.delete("/api-keys/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
 def revoke_api_key(
     key_id: int,
-    current_user: User = Depends(dep_current_user),
+    current_user: AuthenticatedUser = Depends(dep_current_user),
     auth: AuthManager = Depends(dep_auth_manager),
 ):
-    from app.db.models import APIKey
-
     key = auth._db.query(APIKey).filter(APIKey.id == key_id, APIKey.user_id == current_user.id).first()
     if not key:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="API key not found")
     key.is_active = False
     auth._db.commit()
+    clear_api_key_cache()
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: User = Depends(dep_current_user)):
-    return UserResponse.model_validate(current_user)
+def get_me(current_user: AuthenticatedUser = Depends(dep_current_user), auth: AuthManager = Depends(dep_auth_manager)):
+    # Auth resolves only id and role, so load the full profile
+    user = auth.get_user_by_id(current_user.id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UserResponse.model_validate(user)
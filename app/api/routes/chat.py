@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-import json
-
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 from app.api.dependencies import dep_current_user, dep_rag_pipeline
 from app.core.rag_pipeline import RAGPipeline
-from app.db.models import User
+from app.models.auth import AuthenticatedUser
 from app.models.chat import ChatRequest, ChatResponse
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
+# Pre-encoded SSE framing so each event is a single bytes concatenation.
+SSE_DATA_PREFIX = b"data: "
+SSE_EVENT_END = b"\n\n"
+SSE_DONE = b"data: [DONE]\n\n"
+
 
 @router.post("", response_model=ChatResponse)
 async def chat(
     body: ChatRequest,
-    _user: User = Depends(dep_current_user),
+    _user: AuthenticatedUser = Depends(dep_current_user),
     pipeline: RAGPipeline = Depends(dep_rag_pipeline),
 ):
     if body.stream:
@@ -29,6 +34,12 @@ async def chat(
 
 async def _stream_response(pipeline: RAGPipeline, body: ChatRequest):
     async for chunk in pipeline.arag_stream(query=body.query, top_k=body.top_k, filters=body.filters or None):
-        data = json.dumps(chunk, default=str)
-        yield f"data: {data}\n\n"
-    yield "data: [DONE]\n\n"
+        yield SSE_DATA_PREFIX + orjson.dumps(chunk, default=_json_default) + SSE_EVENT_END
+    yield SSE_DONE
+
+
+def _json_default(obj):
+    # Citations arrive as pydantic models; anything else falls back to str.
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import logging
 import shutil
 import tempfile
 import uuid
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile, status
+from pydantic import TypeAdapter
 
 from app.api.dependencies import (
     dep_current_user,
@@ -14,9 +16,9 @@ from app.api.dependencies import (
     dep_db,
 )
 from app.core.document_ingestor import DocumentIngestor
-from app.db.models import User
+from app.db.database import get_session_factory
 from app.db.repositories.document_repository import DocumentRepository
-from app.models.auth import UserRole
+from app.models.auth import AuthenticatedUser, UserRole
 from app.models.common import PaginatedResponse, PaginationParams
 from app.models.documents import (
     DocumentListItem,
@@ -26,17 +28,46 @@ from app.models.documents import (
 )
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+# Copy uploads in 1 MiB blocks instead of shutil's 64 KiB default.
+UPLOAD_COPY_BUFSIZE = 1 << 20
+
+_DOCUMENTS_ADAPTER = TypeAdapter(list[DocumentListItem])
+_DocumentPage = PaginatedResponse[DocumentListItem]
+
+
+def _ingest_in_background(ingestor: DocumentIngestor, file_path: str, metadata: DocumentMetadata) -> None:
+    """Ingest an uploaded file after the response is sent and record the outcome.
+
+    Runs outside the request, so it opens its own DB session.
+    """
+    db = get_session_factory()()
+    try:
+        repo = DocumentRepository(db)
+        repo.update_status(metadata.document_id, DocumentStatus.PROCESSING)
+        try:
+            result = ingestor.ingest(file_path, metadata)
+        except Exception:
+            logger.exception("Ingestion failed for document %s", metadata.document_id)
+            repo.update_status(metadata.document_id, DocumentStatus.FAILED)
+            return
+        repo.update_status(metadata.document_id, result.status, result.chunk_count, page_count=result.page_count)
+    finally:
+        db.close()
 
-@router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_202_ACCEPTED)
 def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     title: str = Form(default=""),
     author: str = Form(default=""),
     tags: str = Form(default=""),
     url: str = Form(default=""),
-    current_user: User = Depends(require_roles(UserRole.CONTRIBUTOR, UserRole.ADMIN)),
+    current_user: AuthenticatedUser = Depends(require_roles(UserRole.CONTRIBUTOR, UserRole.ADMIN)),
     ingestor: DocumentIngestor = Depends(dep_document_ingestor),
     db: Session = Depends(dep_db),
 ):
@@ -50,7 +81,7 @@ def upload_document(
     tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
 
     with tempfile.NamedTemporaryFile(delete=False, suffix=f".{suffix}") as tmp:
-        shutil.copyfileobj(file.file, tmp)
+        shutil.copyfileobj(file.file, tmp, UPLOAD_COPY_BUFSIZE)
         tmp_path = tmp.name
 
     metadata = DocumentMetadata(
@@ -61,74 +92,49 @@ def upload_document(
         tags=tag_list,
     )
 
-    result = ingestor.ingest(tmp_path, metadata)
-
     doc_repo = DocumentRepository(db)
     doc_repo.create(metadata, file.filename, uploaded_by=current_user.id)
-    doc_repo.update_status(doc_id, result.status, result.chunk_count)
+    background_tasks.add_task(_ingest_in_background, ingestor, tmp_path, metadata)
 
     return DocumentUploadResponse(
         document_id=doc_id,
-        status=result.status,
-        chunk_count=result.chunk_count,
-        message=f"Document ingested: {result.chunk_count} chunks from {result.page_count} pages",
+        status=DocumentStatus.PENDING,
+        chunk_count=0,
+        message=f"Document accepted for ingestion; poll GET /documents/{doc_id} for status",
     )
 
 
-@router.get("", response_model=PaginatedResponse[DocumentListItem])
+@router.get("", response_model=_DocumentPage)
 def list_documents(
     offset: int = 0,
     limit: int = 20,
-    _user: User = Depends(dep_current_user),
+    _user: AuthenticatedUser = Depends(dep_current_user),
     db: Session = Depends(dep_db),
 ):
-    repo = DocumentRepository(db)
-    docs = repo.list_all(offset, limit)
-    total = repo.count()
-    items = [
-        DocumentListItem(
-            document_id=d.document_id,
-            title=d.title,
-            author=d.author,
-            path=d.path,
-            tags=repo.get_tags(d),
-            page_count=d.page_count,
-            status=DocumentStatus(d.status),
-            chunk_count=d.chunk_count,
-            created_at=d.created_at,
-        )
-        for d in docs
-    ]
-    return PaginatedResponse(items=items, total=total, offset=offset, limit=limit)
+    docs, total = DocumentRepository(db).list_page(offset, limit)
+    # Tags are decoded from the row's JSON by DocumentListItem, so the whole
+    # page validates in one call without a per-document query.
+    items = _DOCUMENTS_ADAPTER.validate_python(docs, from_attributes=True)
+    return _DocumentPage.model_construct(items=items, total=total, offset=offset, limit=limit)
 
 
 @router.get("/{document_id}", response_model=DocumentListItem)
 def get_document(
     document_id: str,
-    _user: User = Depends(dep_current_user),
+    _user: AuthenticatedUser = Depends(dep_current_user),
     db: Session = Depends(dep_db),
 ):
     repo = DocumentRepository(db)
     doc = repo.get_by_id(document_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
-    return DocumentListItem(
-        document_id=doc.document_id,
-        title=doc.title,
-        author=doc.author,
-        path=doc.path,
-        tags=repo.get_tags(doc),
-        page_count=doc.page_count,
-        status=DocumentStatus(doc.status),
-        chunk_count=doc.chunk_count,
-        created_at=doc.created_at,
-    )
+    return DocumentListItem.model_validate(doc)
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_document(
     document_id: str,
-    current_user: User = Depends(dep_current_user),
+    current_user: AuthenticatedUser = Depends(dep_current_user),
     ingestor: DocumentIngestor = Depends(dep_document_ingestor),
     db: Session = Depends(dep_db),
 ):
@@ -137,8 +143,7 @@ def delete_document(
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
 
-    user_role = UserRole(current_user.role)
-    if user_role != UserRole.ADMIN and doc.uploaded_by != current_user.id:
+    if current_user.role != UserRole.ADMIN and doc.uploaded_by != current_user.id:
         raise HTTPException(status_code=403, detail="Cannot delete another user's document")
 
     ingestor.delete_document(document_id)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from app.api.dependencies import dep_current_user, dep_rag_pipeline
 from app.core.rag_pipeline import RAGPipeline
-from app.db.models import User
+from app.models.auth import AuthenticatedUser
 from app.models.search import SearchRequest, SearchResponse
 
 router = APIRouter(prefix="/search", tags=["Search"])
@@ -13,7 +13,10 @@ router = APIRouter(prefix="/search", tags=["Search"])
 @router.post("", response_model=SearchResponse)
 def search(
     body: SearchRequest,
-    _user: User = Depends(dep_current_user),
+    _user: AuthenticatedUser = Depends(dep_current_user),
     pipeline: RAGPipeline = Depends(dep_rag_pipeline),
 ):
-    return pipeline.search(query=body.query, top_k=body.top_k, filters=body.filters or None)
+    response = pipeline.search(query=body.query, top_k=body.top_k, filters=body.filters or None)
+    # Serialize with pydantic-core directly instead of re-validating against
+    # response_model and encoding through the generic JSON path.
+    return Response(content=response.model_dump_json(), media_type="application/json")
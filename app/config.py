@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True  # binary float32 vectors instead of JSON
+    qdrant_uuid_point_ids: bool = False  # random u64 point IDs unless set
     qdrant_collection: str = "documents"
 
     # JWT
@@ -32,6 +35,7 @@ class Settings(BaseSettings):
 
     # Rate Limiting
     rate_limit_default: str = "60/minute"
+    rate_limit_storage_uri: str = "memory://"  # "redis://host:6379" moves counters into Redis
 
     # Document Processing
     chunk_size: int = 512
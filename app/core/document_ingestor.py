@@ -1,21 +1,122 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import string
 import uuid
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
-
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PayloadSchemaType,
+    PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
+
+from app.config import get_settings
 from app.core.embedding_service import EmbeddingService
-from app.models.documents import ChunkMetadata, DocumentMetadata, DocumentStatus
+from app.core.keyword_search import BM25Searcher, bump_index_generation
+from app.models.documents import DocumentMetadata, DocumentStatus
 from app.utils.pdf_parser import PDFParser, ParsedDocument
 from app.utils.text_chunker import Chunk, TextChunker
 
 logger = logging.getLogger(__name__)
 
+# Common section header patterns, compiled once for _detect_sections
+_SECTION_PATTERNS = tuple(
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'^(?:Chapter|Section|Part)\s+\d+[:\s]+(.+)$',  # Chapter 1: Title
+        r'^\d+\.\d*\s+([A-Z][^.]+)$',  # 1. Introduction
+        r'^([A-Z][A-Z\s]{3,50})$',  # ALL CAPS HEADERS
+        r'^(?:Introduction|Conclusion|Summary|References|Appendix)$',  # Common sections
+    )
+)
+
+# Deletion table for the Arabic block; the length drop after translate()
+# is the Arabic character count, computed in C without building matches.
+_STRIP_ARABIC = dict.fromkeys(range(0x0600, 0x0700))
+_STRIP_WHITESPACE = dict.fromkeys(map(ord, string.whitespace))
+# The Arabic ratio settles within a few KB, so only a prefix is scanned
+LANGUAGE_SAMPLE_CHARS = 4096
+
+# Tag -> lowercase keywords for _extract_tags, flattened once at import
+# instead of rebuilding the four category dicts for every chunk.
+_TAG_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    # Company-related tags
+    ("realsoft", ("company", "realsoft", "organization")),
+    ("mission", ("mission", "vision", "values", "goals")),
+    ("about", ("about", "company info", "overview")),
+    # Product tags
+    ("al-khwarizmi", ("al-khwarizmi", "khwarizmi", "الخوارزمي")),
+    ("falconmap", ("falconmap", "falcon map", "falcon")),
+    ("realdata", ("realdata", "real data", "data hub", "data flow")),
+    ("adaa", ("adaa", "ada'a", "performance")),
+    # Service tags
+    ("statistics", ("statistical", "statistics", "census", "survey")),
+    ("gis", ("gis", "mapping", "geographic", "spatial")),
+    ("digital", ("digital transformation", "digitization", "automation")),
+    ("consulting", ("consulting", "consultant", "advisory")),
+    ("outsourcing", ("outsourcing", "talent", "resources")),
+    # Partner tags
+    ("microsoft", ("microsoft", "azure", "cloud")),
+    ("esri", ("esri", "arcgis")),
+    ("mendix", ("mendix", "low-code", "low code")),
+)
+
+# Chunks are embedded and upserted in slices of UPSERT_BATCH_SIZE points,
+# with up to UPSERT_CONCURRENCY upserts in flight while the next slice
+# embeds. EMBED_BATCH_SIZE is the encoder batch size within a slice.
+EMBED_BATCH_SIZE = 32
+UPSERT_BATCH_SIZE = 64
+UPSERT_CONCURRENCY = 4
+# Files ingested at once by ingest_many; parsing, encoding and Qdrant I/O
+# mostly release the GIL, so threads overlap them across files.
+INGEST_CONCURRENCY = 4
+
+# int8 scalar quantization for new collections: 4x smaller vectors kept in
+# RAM for the HNSW walk, with the float32 originals used for rescoring
+# (see qdrant_utils.QUANTIZED_SEARCH_PARAMS).
+VECTOR_QUANTIZATION = ScalarQuantization(
+    scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True),
+)
+
+# Payload fields that search filters hit, indexed so Qdrant can filter
+# before the vector search instead of scanning payloads afterwards.
+PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "document_id": PayloadSchemaType.KEYWORD,
+    "category": PayloadSchemaType.KEYWORD,
+    "language": PayloadSchemaType.KEYWORD,
+    "tags": PayloadSchemaType.KEYWORD,
+    "section": PayloadSchemaType.KEYWORD,
+    "page": PayloadSchemaType.INTEGER,
+}
+
+# Payload fields (and defaults) mirrored into an attached BM25 index; the
+# same set HybridRetriever reads when it builds the index from Qdrant.
+_KEYWORD_META_DEFAULTS = {
+    "document_id": "",
+    "title": "",
+    "author": "",
+    "page": 0,
+    "section": "",
+    "chunk_index": 0,
+    "tags": [],
+}
+
 
 @dataclass
 class IngestResult:
@@ -36,12 +137,15 @@ class DocumentIngestor:
         collection_name: str,
         pdf_parser: PDFParser | None = None,
         text_chunker: TextChunker | None = None,
+        keyword_index: BM25Searcher | None = None,
     ):
         self._embedding = embedding_service
         self._qdrant = qdrant_client
         self._collection = collection_name
         self._pdf_parser = pdf_parser or PDFParser()
         self._chunker = text_chunker or TextChunker()
+        self._keyword_index = keyword_index
+        self._uuid_point_ids = get_settings().qdrant_uuid_point_ids
         self._ensure_collection()
 
     def ingest(self, file_path: str | Path, metadata: DocumentMetadata) -> IngestResult:
@@ -53,7 +157,10 @@ class DocumentIngestor:
         metadata.file_type = file_path.suffix.lower()
 
         parsed = self._parse_file(file_path)
-        if not parsed or not parsed.pages:
+        # PDF pages arrive lazily, so look at the first one to check for content
+        pages = iter(parsed.pages) if parsed else iter(())
+        first_page = next(pages, None)
+        if first_page is None:
             return IngestResult(
                 document_id=metadata.document_id,
                 chunk_count=0,
@@ -72,42 +179,41 @@ class DocumentIngestor:
         metadata.page_count = parsed.page_count
 
         # Detect language from first page
-        if parsed.pages:
-            metadata.language = self._detect_language(parsed.pages[0].text)
+        metadata.language = self._detect_language(first_page.text)
 
-        pages_data = [
-            {"text": p.text, "page": p.page_number, "is_ocr": p.is_ocr}
-            for p in parsed.pages
-        ]
         chunks = self._chunker.chunk_pages(
-            [{"text": p["text"], "page_number": p["page"]} for p in pages_data]
+            {"text": p.text, "page_number": p.page_number} for p in chain((first_page,), pages)
         )
 
         # Detect sections from chunk text
         sections = self._detect_sections(chunks)
+        document_tags = self._document_tags(metadata)
+
+        # Document-level payload fields, built once; each chunk's payload is
+        # this plus its own text, position, page, section and tags
+        base_payload = {
+            "document_id": metadata.document_id,
+            "title": metadata.title,
+            "author": metadata.author,
+            "path": str(file_path),
+            "url": metadata.url,
+            "category": metadata.category,
+            "language": metadata.language,
+        }
+        payloads = [
+            {
+                **base_payload,
+                "text": chunk.text,
+                "chunk_index": chunk.chunk_index,
+                "page": chunk.metadata.get("page_number", 0),
+                "section": sections.get(i, ""),
+                # Merge document-level tags with tags from the chunk text
+                "tags": list(document_tags.union(self._extract_tags(chunk.text.lower()))),
+            }
+            for i, chunk in enumerate(chunks)
+        ]
 
-        for i, chunk in enumerate(chunks):
-            section = sections.get(i, "")
-            # Extract tags from chunk text
-            chunk_tags = self._extract_tags(chunk.text, metadata.title)
-            # Merge with existing tags
-            all_tags = list(set(metadata.tags + chunk_tags))
-            chunk.metadata.update(
-                {
-                    "document_id": metadata.document_id,
-                    "title": metadata.title,
-                    "author": metadata.author,
-                    "path": str(file_path),
-                    "tags": all_tags,
-                    "url": metadata.url,
-                    "section": section,
-                    "page": chunk.metadata.get("page_number", 0),
-                    "category": metadata.category,
-                    "language": metadata.language,
-                }
-            )
-
-        chunk_count = self._embed_and_store(chunks)
+        chunk_count = self._embed_and_store(chunks, payloads)
 
         return IngestResult(
             document_id=metadata.document_id,
@@ -116,97 +222,75 @@ class DocumentIngestor:
             status=DocumentStatus.INDEXED,
         )
 
+    def ingest_many(
+        self,
+        items: list[tuple[str | Path, DocumentMetadata]],
+        max_workers: int = INGEST_CONCURRENCY,
+    ) -> list[IngestResult]:
+        """Ingest several files concurrently; results follow the input order.
+
+        A file that raises is reported as a FAILED result instead of
+        aborting the rest of the batch.
+        """
+
+        def ingest_one(item: tuple[str | Path, DocumentMetadata]) -> IngestResult:
+            file_path, metadata = item
+            try:
+                return self.ingest(file_path, metadata)
+            except Exception as e:
+                logger.exception("Failed to ingest %s", file_path)
+                return IngestResult(
+                    document_id=metadata.document_id,
+                    chunk_count=0,
+                    page_count=0,
+                    status=DocumentStatus.FAILED,
+                    errors=[str(e)],
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest") as pool:
+            return list(pool.map(ingest_one, items))
+
     def _detect_language(self, text: str) -> str:
         """Detect document language."""
-        # Simple heuristic: check for Arabic characters
-        arabic_chars = sum(1 for c in text if '\u0600' <= c <= '\u06FF')
-        total_chars = len(text.strip())
+        # Simple heuristic: share of Arabic among non-whitespace characters
+        sample = text[:LANGUAGE_SAMPLE_CHARS]
+        arabic_chars = len(sample) - len(sample.translate(_STRIP_ARABIC))
+        total_chars = len(sample.translate(_STRIP_WHITESPACE))
         if total_chars > 0 and arabic_chars / total_chars > 0.3:
             return "ar"
         return "en"
 
-    def _extract_tags(self, text: str, title: str) -> list[str]:
-        """Extract relevant tags from text content."""
-        text_lower = text.lower()
-        tags = set()
-        
-        # Company-related tags
-        company_keywords = {
-            "realsoft": ["company", "realsoft", "organization"],
-            "mission": ["mission", "vision", "values", "goals"],
-            "about": ["about", "company info", "overview"],
-        }
-        
-        # Product tags
-        product_keywords = {
-            "al-khwarizmi": ["al-khwarizmi", "khwarizmi", "الخوارزمي"],
-            "falconmap": ["falconmap", "falcon map", "falcon"],
-            "realdata": ["realdata", "real data", "data hub", "data flow"],
-            "adaa": ["adaa", "ada'a", "performance"],
-        }
-        
-        # Service tags
-        service_keywords = {
-            "statistics": ["statistical", "statistics", "census", "survey"],
-            "gis": ["gis", "mapping", "geographic", "spatial"],
-            "digital": ["digital transformation", "digitization", "automation"],
-            "consulting": ["consulting", "consultant", "advisory"],
-            "outsourcing": ["outsourcing", "talent", "resources"],
-        }
-        
-        # Partner tags
-        partner_keywords = {
-            "microsoft": ["microsoft", "azure", "cloud"],
-            "esri": ["esri", "arcgis"],
-            "mendix": ["mendix", "low-code", "low code"],
-        }
-        
-        # Check each category
-        all_keywords = {
-            **{k: v for k, v in company_keywords.items()},
-            **{k: v for k, v in product_keywords.items()},
-            **{k: v for k, v in service_keywords.items()},
-            **{k: v for k, v in partner_keywords.items()},
-        }
-        
-        for tag, keywords in all_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                tags.add(tag)
+    def _extract_tags(self, text_lower: str) -> set[str]:
+        """Extract keyword tags from already-lowercased chunk text."""
+        return {tag for tag, keywords in _TAG_KEYWORDS if any(kw in text_lower for kw in keywords)}
+
+    def _document_tags(self, metadata: DocumentMetadata) -> frozenset[str]:
+        """Tags shared by every chunk: caller-supplied, title-based and language."""
+        tags = set(metadata.tags)
         
         # Add title-based tags
-        title_lower = title.lower()
+        title_lower = metadata.title.lower()
         if "flyer" in title_lower or "brochure" in title_lower:
             tags.add("marketing")
         if "content" in title_lower:
             tags.add("content")
         
         # Add language tag
-        if self._detect_language(text) == "ar":
-            tags.add("arabic")
-        else:
-            tags.add("english")
+        tags.add("arabic" if metadata.language == "ar" else "english")
         
-        return sorted(list(tags))
+        return frozenset(tags)
 
     def _detect_sections(self, chunks: list[Chunk]) -> dict[int, str]:
         """Detect section headers from chunk text."""
         sections: dict[int, str] = {}
         current_section = ""
 
-        # Common section header patterns
-        section_patterns = [
-            r'^(?:Chapter|Section|Part)\s+\d+[:\s]+(.+)$',  # Chapter 1: Title
-            r'^\d+\.\d*\s+([A-Z][^.]+)$',  # 1. Introduction
-            r'^([A-Z][A-Z\s]{3,50})$',  # ALL CAPS HEADERS
-            r'^(?:Introduction|Conclusion|Summary|References|Appendix)$',  # Common sections
-        ]
-
         for i, chunk in enumerate(chunks):
             text = chunk.text.strip()
             first_line = text.split('\n')[0] if text else ""
 
-            for pattern in section_patterns:
-                match = re.match(pattern, first_line, re.IGNORECASE)
+            for pattern in _SECTION_PATTERNS:
+                match = pattern.match(first_line)
                 if match:
                     current_section = match.group(1) if match.groups() else first_line
                     break
@@ -216,8 +300,6 @@ class DocumentIngestor:
         return sections
 
     def delete_document(self, document_id: str) -> bool:
-        from qdrant_client.models import FieldCondition, Filter, MatchValue
-
         try:
             self._qdrant.delete(
                 collection_name=self._collection,
@@ -225,15 +307,18 @@ class DocumentIngestor:
                     must=[FieldCondition(key="document_id", match=MatchValue(value=document_id))]
                 ),
             )
-            return True
         except Exception:
             logger.exception("Failed to delete document %s from Qdrant", document_id)
             return False
+        bump_index_generation(self._collection)
+        if self._keyword_index is not None:
+            self._keyword_index.remove_document_chunks(document_id)
+        return True
 
     def _parse_file(self, file_path: Path) -> ParsedDocument | None:
         suffix = file_path.suffix.lower()
         if suffix == ".pdf":
-            return self._pdf_parser.parse(file_path)
+            return self._pdf_parser.parse_lazy(file_path)
         elif suffix == ".docx":
             return self._parse_docx(file_path)
         else:
@@ -254,34 +339,59 @@ class DocumentIngestor:
         pages = [PageContent(page_number=1, text=full_text)] if full_text else []
         return ParsedDocument(pages=pages, metadata=metadata, page_count=1)
 
-    def _embed_and_store(self, chunks: list[Chunk]) -> int:
+    def _embed_and_store(self, chunks: list[Chunk], payloads: list[dict]) -> int:
+        """Embed chunks slice by slice, upserting each slice while the next embeds.
+
+        payloads[i] is stored as chunk i's Qdrant payload as is.
+        """
         if not chunks:
             return 0
 
-        texts = [c.text for c in chunks]
-        vectors = self._embedding.embed_batch(texts)
-
-        points = [
-            PointStruct(
-                id=str(uuid.uuid4()),
-                vector=vec,
-                payload={
-                    "text": chunk.text,
-                    "chunk_index": chunk.chunk_index,
-                    **{k: v for k, v in chunk.metadata.items() if k != "page_number"},
-                },
-            )
-            for chunk, vec in zip(chunks, vectors)
-        ]
-
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            self._qdrant.upsert(
-                collection_name=self._collection,
-                points=points[i : i + batch_size],
-            )
-
-        return len(points)
+        in_flight: deque[Future] = deque()
+        keyword_items: list[tuple[str, str, dict]] = []
+        with ThreadPoolExecutor(max_workers=UPSERT_CONCURRENCY) as pool:
+            for i in range(0, len(chunks), UPSERT_BATCH_SIZE):
+                batch = chunks[i : i + UPSERT_BATCH_SIZE]
+                batch_payloads = payloads[i : i + UPSERT_BATCH_SIZE]
+                vectors = self._embedding.embed_batch(
+                    [c.text for c in batch], batch_size=EMBED_BATCH_SIZE
+                )
+                point_ids = (
+                    [str(uuid.uuid4()) for _ in batch]
+                    if self._uuid_point_ids
+                    else _random_point_ids(len(batch))
+                )
+                points = [
+                    PointStruct(id=point_id, vector=vec, payload=payload)
+                    for point_id, payload, vec in zip(point_ids, batch_payloads, vectors)
+                ]
+                if self._keyword_index is not None:
+                    keyword_items.extend(
+                        (
+                            str(p.id),
+                            p.payload["text"],
+                            {k: p.payload.get(k, d) for k, d in _KEYWORD_META_DEFAULTS.items()},
+                        )
+                        for p in points
+                    )
+                # Bound queued batches so embedding cannot run far ahead of Qdrant
+                if len(in_flight) >= UPSERT_CONCURRENCY:
+                    in_flight.popleft().result()
+                in_flight.append(
+                    pool.submit(
+                        self._qdrant.upsert,
+                        collection_name=self._collection,
+                        points=points,
+                    )
+                )
+            for future in in_flight:
+                future.result()
+
+        bump_index_generation(self._collection)
+        if self._keyword_index is not None:
+            self._keyword_index.add_documents_incremental(keyword_items)
+
+        return len(chunks)
 
     def _ensure_collection(self) -> None:
         collections = [c.name for c in self._qdrant.get_collections().collections]
@@ -292,5 +402,28 @@ class DocumentIngestor:
                     size=self._embedding.dimension,
                     distance=Distance.COSINE,
                 ),
+                quantization_config=VECTOR_QUANTIZATION,
             )
             logger.info("Created Qdrant collection: %s", self._collection)
+            ensure_payload_indexes(self._qdrant, self._collection)
+
+
+def _random_point_ids(n: int) -> list[int]:
+    """Random unsigned 64-bit Qdrant point IDs from a single urandom read."""
+    return array("Q", os.urandom(8 * n)).tolist()
+
+
+def ensure_payload_indexes(qdrant: QdrantClient, collection_name: str) -> None:
+    """Create any PAYLOAD_INDEXES missing from the collection."""
+    existing = qdrant.get_collection(collection_name).payload_schema or {}
+    for field_name, schema in PAYLOAD_INDEXES.items():
+        if field_name in existing:
+            continue
+        try:
+            qdrant.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=schema,
+            )
+        except Exception:
+            logger.warning("Failed to create payload index %s on %s", field_name, collection_name, exc_info=True)
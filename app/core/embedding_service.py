@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 import requests
+from requests.adapters import HTTPAdapter
 from sentence_transformers import SentenceTransformer
+from urllib3.util.retry import Retry
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the embedding API session; retries cover transient
+# gateway errors, which are safe to repeat since embedding is idempotent.
+API_POOL_MAXSIZE = 16
+API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)
+# embed_batch shards large API requests into API_BATCH_SIZE texts and
+# sends up to API_CONCURRENCY shards at once over the pooled session.
+API_BATCH_SIZE = 16
+API_CONCURRENCY = 5
+
 
 class EmbeddingService:
     """Generates embeddings using local sentence-transformers or external API."""
@@ -23,12 +41,23 @@ class EmbeddingService:
         self._api_key = settings.deepseek_api_key
         self._model_name = model_name or settings.embedding_model
         self._model: SentenceTransformer | None = None
+        self._session: requests.Session | None = None
+        self._api_pool: ThreadPoolExecutor | None = None
 
         if self._service_type == "local":
             logger.info("Loading embedding model: %s", self._model_name)
             self._model = SentenceTransformer(self._model_name)
         else:
             logger.info("Using external embedding API: %s", self._api_url)
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=API_POOL_MAXSIZE, max_retries=API_RETRY)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            if self._api_key:
+                self._session.headers["Authorization"] = f"Bearer {self._api_key}"
+            self._api_pool = ThreadPoolExecutor(
+                max_workers=API_CONCURRENCY, thread_name_prefix="embedding-api"
+            )
 
     def embed_text(self, text: str) -> list[float]:
         if self._service_type == "local":
@@ -37,23 +66,25 @@ class EmbeddingService:
         else:
             return self._embed_via_api([text])[0]
 
+    async def aembed_text(self, text: str) -> list[float]:
+        return await asyncio.to_thread(self.embed_text, text)
+
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         if self._service_type == "local":
             vectors = self._model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
             return vectors.tolist()
-        else:
+        if len(texts) <= API_BATCH_SIZE:
             return self._embed_via_api(texts)
+        shards = [texts[i : i + API_BATCH_SIZE] for i in range(0, len(texts), API_BATCH_SIZE)]
+        # map() yields in submission order, so vectors line up with texts
+        return [vec for part in self._api_pool.map(self._embed_via_api, shards) for vec in part]
 
     def _embed_via_api(self, texts: list[str]) -> list[list[float]]:
         """Call external embedding API."""
         try:
-            headers = {}
-            if self._api_key:
-                headers["Authorization"] = f"Bearer {self._api_key}"
-            response = requests.post(
+            response = self._session.post(
                 self._api_url,
                 json={"texts": texts},
-                headers=headers,
                 timeout=60,
             )
             response.raise_for_status()
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
 from qdrant_client import QdrantClient
+from qdrant_client.models import QueryRequest
 
 from app.core.embedding_service import EmbeddingService
-from app.core.keyword_search import BM25Searcher, KeywordResult
+from app.core.keyword_search import BM25Searcher, KeywordResult, index_generation, index_path
+from app.core.qdrant_utils import QUANTIZED_SEARCH_PARAMS, SEARCH_RESULT_PAYLOAD, build_qdrant_filter
 from app.core.retrieval_config import get_retrieval_settings
 from app.models.common import MetadataFilter
 from app.models.search import SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Page size for the full-collection scroll that feeds the BM25 index, and
+# the payload fields it actually reads; vectors are never fetched.
+KEYWORD_INDEX_SCROLL_LIMIT = 2048
+KEYWORD_INDEX_PAYLOAD = SEARCH_RESULT_PAYLOAD
+
 
 @dataclass
 class FusionResult:
@@ -47,19 +57,24 @@ class HybridRetriever:
         self._collection = collection_name
         self._bm25 = BM25Searcher()
         self._settings = get_retrieval_settings()
+        self._index_path: Path | None = index_path(collection_name)
         
         # Cache for keyword index
-        self._index_built: bool = False
+        self._index_built: bool = self._load_keyword_index()
     
     def search(
         self,
         query: str,
         filters: list[MetadataFilter] | None = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        fusion_method: str | None = None,
     ) -> tuple[list[SearchResult], dict]:
         """
         Perform hybrid search and return fused results.
         
+        fusion_method overrides the configured method ("rrf" or "weighted")
+        for this call only; the shared settings are never mutated.
+        
         Returns:
             Tuple of (search_results, debug_info)
         """
@@ -71,11 +86,73 @@ class HybridRetriever:
         # Step 2: Keyword retrieval (build index if needed or not cached)
         keyword_results = self._keyword_search(query, settings.top_k_keyword, use_cache)
         
-        # Step 3: Fuse results
-        fused_results = self._fuse_results(dense_results, keyword_results)
+        # Step 3-4: Fuse results and keep the top final_top_k
+        return self._finalize(dense_results, keyword_results, fusion_method)
+    
+    def search_many(
+        self,
+        queries: list[str],
+        filters: list[MetadataFilter] | None = None,
+        use_cache: bool = True,
+        fusion_method: str | None = None,
+    ) -> list[tuple[list[SearchResult], dict]]:
+        """
+        Perform hybrid search for several queries at once.
+        
+        Queries are embedded in one batch and sent to Qdrant in a single
+        query_batch_points call, while BM25 runs on a worker thread. With
+        use_cache=False the keyword index is rebuilt once, not per query.
+        
+        Returns:
+            One (search_results, debug_info) tuple per query, in input order
+        """
+        if not queries:
+            return []
+        settings = self._settings
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            keyword_future = pool.submit(
+                lambda: [
+                    self._keyword_search(q, settings.top_k_keyword, use_cache or i > 0)
+                    for i, q in enumerate(queries)
+                ]
+            )
+            
+            qdrant_filter = self._build_filter(filters)
+            vectors = self._embedding.embed_batch(queries)
+            responses = self._qdrant.query_batch_points(
+                collection_name=self._collection,
+                requests=[
+                    QueryRequest(
+                        query=vec,
+                        filter=qdrant_filter,
+                        limit=settings.top_k_dense,
+                        params=QUANTIZED_SEARCH_PARAMS,
+                        with_payload=SEARCH_RESULT_PAYLOAD,
+                    )
+                    for vec in vectors
+                ],
+            )
+            dense_batches = [[self._point_to_result(p) for p in r.points] for r in responses]
+            keyword_batches = keyword_future.result()
         
-        # Step 4: Return top_k final results
-        final_results = fused_results[:settings.final_top_k]
+        return [
+            self._finalize(dense_results, keyword_results, fusion_method)
+            for dense_results, keyword_results in zip(dense_batches, keyword_batches)
+        ]
+    
+    def _finalize(
+        self,
+        dense_results: list[SearchResult],
+        keyword_results: list[KeywordResult],
+        fusion_method: str | None = None,
+    ) -> tuple[list[SearchResult], dict]:
+        """Fuse one query's dense and keyword results into SearchResults plus debug info."""
+        settings = self._settings
+        method = fusion_method or settings.fusion_method
+        final_results = self._fuse_results(
+            dense_results, keyword_results, settings.final_top_k, method
+        )
         
         # Convert to SearchResult format
         search_results = [
@@ -98,10 +175,10 @@ class HybridRetriever:
         debug_info = {
             "dense_count": len(dense_results),
             "keyword_count": len(keyword_results),
-            "fusion_method": settings.fusion_method,
-            "dense_weight": settings.dense_weight if settings.fusion_method == "weighted" else None,
-            "keyword_weight": settings.keyword_weight if settings.fusion_method == "weighted" else None,
-            "rrf_k": settings.rrf_k if settings.fusion_method == "rrf" else None,
+            "fusion_method": method,
+            "dense_weight": settings.dense_weight if method == "weighted" else None,
+            "keyword_weight": settings.keyword_weight if method == "weighted" else None,
+            "rrf_k": settings.rrf_k if method == "rrf" else None,
         }
         
         return search_results, debug_info
@@ -113,46 +190,40 @@ class HybridRetriever:
         filters: list[MetadataFilter] | None = None
     ) -> list[SearchResult]:
         """Perform dense vector search using Qdrant."""
-        from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue, Range
-        
         query_vector = self._embedding.embed_text(query)
         
-        # Build filter if provided
-        qdrant_filter = None
-        if filters:
-            conditions = []
-            for f in filters:
-                if f.operator == "eq":
-                    conditions.append(FieldCondition(key=f.field, match=MatchValue(value=f.value)))
-                elif f.operator == "in" and isinstance(f.value, list):
-                    conditions.append(FieldCondition(key=f.field, match=MatchAny(any=f.value)))
-                elif f.operator in ("gt", "gte", "lt", "lte"):
-                    range_kwargs = {f.operator: f.value}
-                    conditions.append(FieldCondition(key=f.field, range=Range(**range_kwargs)))
-            qdrant_filter = Filter(must=conditions) if conditions else None
-        
         results = self._qdrant.query_points(
             collection_name=self._collection,
             query=query_vector,
-            query_filter=qdrant_filter,
+            query_filter=self._build_filter(filters),
             limit=top_k,
-            with_payload=True,
+            search_params=QUANTIZED_SEARCH_PARAMS,
+            with_payload=SEARCH_RESULT_PAYLOAD,
         ).points
         
-        return [
-            SearchResult(
-                chunk_text=r.payload.get("text", ""),
-                score=r.score,
-                document_id=r.payload.get("document_id", ""),
-                title=r.payload.get("title", ""),
-                author=r.payload.get("author", ""),
-                page=r.payload.get("page", 0),
-                section=r.payload.get("section", ""),
-                chunk_index=r.payload.get("chunk_index", 0),
-                tags=r.payload.get("tags", []),
-            )
-            for r in results
-        ]
+        return [self._point_to_result(r) for r in results]
+    
+    @staticmethod
+    def _build_filter(filters: list[MetadataFilter] | None):
+        """Translate metadata filters into a Qdrant Filter, or None."""
+        return build_qdrant_filter(filters)
+    
+    @staticmethod
+    def _point_to_result(point) -> SearchResult:
+        """Convert a scored Qdrant point into a SearchResult."""
+        payload = point.payload
+        # Trusted Qdrant output, so skip pydantic validation
+        return SearchResult.model_construct(
+            chunk_text=payload.get("text", ""),
+            score=point.score,
+            document_id=payload.get("document_id", ""),
+            title=payload.get("title", ""),
+            author=payload.get("author", ""),
+            page=payload.get("page", 0),
+            section=payload.get("section", ""),
+            chunk_index=payload.get("chunk_index", 0),
+            tags=payload.get("tags", []),
+        )
     
     def _keyword_search(self, query: str, top_k: int, use_cache: bool) -> list[KeywordResult]:
         """Perform BM25 keyword search."""
@@ -162,61 +233,133 @@ class HybridRetriever:
         
         return self._bm25.search(query, top_k)
     
+    def _load_keyword_index(self) -> bool:
+        """Load the persisted BM25 index if it matches the collection's current stamp."""
+        if self._index_path is None:
+            return False
+        try:
+            version = self._index_stamp()
+        except Exception:
+            logger.warning("Could not read %s; skipping BM25 index load", self._collection, exc_info=True)
+            return False
+        
+        if not self._bm25.load(self._index_path, version):
+            return False
+        logger.info("BM25 index loaded from %s (%d documents)", self._index_path, self._bm25.total_docs)
+        return True
+    
     def _build_keyword_index(self):
         """Build BM25 index from all documents in Qdrant."""
         logger.info("Building BM25 keyword index...")
-        self._bm25.clear()
+        # Stamp before scrolling: a point written mid-scroll then leaves the
+        # saved index looking stale rather than fresh
+        try:
+            version = self._index_stamp()
+        except Exception:
+            logger.warning("Could not count %s; the rebuilt index will not be saved", self._collection, exc_info=True)
+            version = None
         
-        # Scroll through all points in collection
-        offset = None
-        batch_size = 100
-        total_indexed = 0
-        
-        while True:
-            response = self._qdrant.scroll(
-                collection_name=self._collection,
-                limit=batch_size,
-                offset=offset,
-                with_payload=True,
-            )
-            
-            points = response[0]
-            if not points:
-                break
+        # Log ingests and deletes that land while the scroll runs, so the
+        # swap below replays them instead of dropping them
+        self._bm25.begin_rebuild()
+        try:
+            # Scroll through all points in collection
+            offset = None
+            items = []
             
-            for point in points:
-                payload = point.payload or {}
-                chunk_id = str(point.id)
-                text = payload.get("text", "")
+            while True:
+                response = self._qdrant.scroll(
+                    collection_name=self._collection,
+                    limit=KEYWORD_INDEX_SCROLL_LIMIT,
+                    offset=offset,
+                    with_payload=KEYWORD_INDEX_PAYLOAD,
+                    with_vectors=False,
+                )
                 
-                if text:
-                    metadata = {
-                        "document_id": payload.get("document_id", ""),
-                        "title": payload.get("title", ""),
-                        "author": payload.get("author", ""),
-                        "page": payload.get("page", 0),
-                        "section": payload.get("section", ""),
-                        "chunk_index": payload.get("chunk_index", 0),
-                        "tags": payload.get("tags", []),
-                    }
-                    self._bm25.add_document(chunk_id, text, metadata)
-                    total_indexed += 1
-            
-            offset = response[1]
-            if offset is None:
-                break
+                points = response[0]
+                if not points:
+                    break
+                
+                for point in points:
+                    payload = point.payload or {}
+                    chunk_id = str(point.id)
+                    text = payload.get("text", "")
+                    
+                    if text:
+                        metadata = {
+                            "document_id": payload.get("document_id", ""),
+                            "title": payload.get("title", ""),
+                            "author": payload.get("author", ""),
+                            "page": payload.get("page", 0),
+                            "section": payload.get("section", ""),
+                            "chunk_index": payload.get("chunk_index", 0),
+                            "tags": payload.get("tags", []),
+                        }
+                        items.append((chunk_id, text, metadata))
+                
+                offset = response[1]
+                if offset is None:
+                    break
+        except BaseException:
+            self._bm25.abort_rebuild()
+            raise
         
-        self._bm25.build_vocab()
+        # Swap the corpus in one locked step so concurrent searches and
+        # incremental ingests never see a half-built index
+        self._bm25.rebuild(items)
         self._index_built = True
-        logger.info("BM25 index built with %d documents", total_indexed)
+        logger.info("BM25 index built with %d documents", len(items))
+        if version is not None:
+            self._save_keyword_index(version)
+    
+    def rebuild_keyword_index(self):
+        """Rebuild the BM25 index from the whole collection and persist it."""
+        self._build_keyword_index()
+    
+    def save_keyword_index(self):
+        """Persist the live BM25 index after ingests have updated it in place.
+        
+        A no-op until the index has been loaded or built, since an index
+        that only holds incrementally added chunks is not the full corpus.
+        """
+        if not self._index_built or self._index_path is None:
+            return
+        try:
+            version = self._index_stamp()
+        except Exception:
+            logger.warning("Could not count %s; skipping BM25 index save", self._collection, exc_info=True)
+            return
+        self._save_keyword_index(version)
+    
+    def _index_stamp(self) -> str:
+        """Cheap staleness stamp: the point count plus the ingest-maintained generation.
+        
+        DocumentIngestor bumps the generation on every upsert and delete, so
+        a delete-then-ingest that keeps the count still changes the stamp.
+        """
+        point_count = self._qdrant.count(collection_name=self._collection, exact=True).count
+        return f"{point_count}:{index_generation(self._collection)}"
+    
+    def _save_keyword_index(self, version: str):
+        """Write the BM25 index to its cache path, logging rather than raising on failure."""
+        if self._index_path is None:
+            return
+        try:
+            self._bm25.save(self._index_path, version)
+        except OSError:
+            logger.warning("Could not persist BM25 index to %s", self._index_path, exc_info=True)
     
     def _fuse_results(
         self,
         dense_results: list[SearchResult],
-        keyword_results: list[KeywordResult]
+        keyword_results: list[KeywordResult],
+        top_k: int,
+        fusion_method: str,
     ) -> list[FusionResult]:
-        """Fuse dense and keyword results using configured fusion method."""
+        """Fuse dense and keyword results and return the top_k by fused score."""
         settings = self._settings
+        use_rrf = fusion_method == "rrf"
+        rrf_k = settings.rrf_k
         
         # Create lookup by document+chunk for deduplication
         # Use (document_id, chunk_index) as unique key
@@ -230,7 +373,8 @@ class HybridRetriever:
                 chunk_text=result.chunk_text,
                 dense_score=result.score,
                 keyword_score=0.0,
-                fused_score=0.0,  # Will be computed
+                # RRF adds 1/(k + rank) for each list the item appears in
+                fused_score=1.0 / (rrf_k + rank) if use_rrf else 0.0,
                 document_id=result.document_id,
                 title=result.title,
                 author=result.author,
@@ -244,14 +388,17 @@ class HybridRetriever:
         for rank, result in enumerate(keyword_results, 1):
             key = (result.document_id, result.chunk_index)
             if key in all_results:
-                all_results[key].keyword_score = result.score
+                existing = all_results[key]
+                existing.keyword_score = result.score
+                if use_rrf:
+                    existing.fused_score += 1.0 / (rrf_k + rank)
             else:
                 all_results[key] = FusionResult(
                     chunk_id=result.chunk_id,
                     chunk_text=result.chunk_text,
                     dense_score=0.0,
                     keyword_score=result.score,
-                    fused_score=0.0,
+                    fused_score=1.0 / (rrf_k + rank) if use_rrf else 0.0,
                     document_id=result.document_id,
                     title=result.title,
                     author=result.author,
@@ -261,44 +408,13 @@ class HybridRetriever:
                     tags=result.tags,
                 )
         
-        # Apply fusion method
-        if settings.fusion_method == "rrf":
-            fused = self._reciprocal_rank_fusion(list(all_results.values()), dense_results, keyword_results)
-        else:
-            fused = self._weighted_fusion(list(all_results.values()))
-        
-        # Sort by fused score descending
-        fused.sort(key=lambda x: x.fused_score, reverse=True)
-        
-        return fused
-    
-    def _reciprocal_rank_fusion(
-        self,
-        all_results: list[FusionResult],
-        dense_results: list[SearchResult],
-        keyword_results: list[KeywordResult]
-    ) -> list[FusionResult]:
-        """Apply Reciprocal Rank Fusion (RRF)."""
-        k = self._settings.rrf_k
-        
-        # Create rank lookups
-        dense_ranks = {(r.document_id, r.chunk_index): rank for rank, r in enumerate(dense_results, 1)}
-        keyword_ranks = {(r.document_id, r.chunk_index): rank for rank, r in enumerate(keyword_results, 1)}
-        
-        for result in all_results:
-            dense_rank = dense_ranks.get((result.document_id, result.chunk_index), 0)
-            keyword_rank = keyword_ranks.get((result.document_id, result.chunk_index), 0)
-            
-            # RRF score: sum of 1/(k + rank) for each list where item appears
-            score = 0.0
-            if dense_rank > 0:
-                score += 1.0 / (k + dense_rank)
-            if keyword_rank > 0:
-                score += 1.0 / (k + keyword_rank)
-            
-            result.fused_score = score
+        # RRF scores were accumulated during the merge above
+        fused = list(all_results.values())
+        if not use_rrf:
+            fused = self._weighted_fusion(fused)
         
-        return all_results
+        # Top-k by fused score descending (same order as a stable sort)
+        return heapq.nlargest(top_k, fused, key=lambda x: x.fused_score)
     
     def _weighted_fusion(self, all_results: list[FusionResult]) -> list[FusionResult]:
         """Apply weighted score fusion."""
@@ -319,7 +435,14 @@ class HybridRetriever:
         
         return all_results
     
+    @property
+    def keyword_index(self) -> BM25Searcher:
+        """The live BM25 index; pass it to DocumentIngestor to keep it current."""
+        return self._bm25
+    
     def clear_index(self):
         """Clear the keyword index (useful for reindexing)."""
         self._bm25.clear()
         self._index_built = False
+        if self._index_path is not None:
+            BM25Searcher.delete_saved(self._index_path)
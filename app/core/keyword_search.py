@@ -2,16 +2,127 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
-import re
-from collections import defaultdict
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+import uuid
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
 
 from app.core.retrieval_config import get_retrieval_settings
+from app.utils.tokenizer import text_stats, tokenize
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy kernel below is the fallback
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Bumped whenever the pickled corpus layout in BM25Searcher.save or the
+# tokenizer changes
+_INDEX_FORMAT_VERSION = 5
+
+# Posting arrays saved next to the pickle as raw .npy files, so load() can
+# memory-map them instead of rebuilding the inverted index
+_POSTING_ARRAYS = ("rows", "tfs")
+
+# add_documents_batch tokenizes in worker processes once a batch has this
+# many new distinct texts; below it the pickling round-trip costs more
+# than it saves. Texts are sent to workers in chunks of TOKENIZE_CHUNKSIZE.
+PARALLEL_TOKENIZE_MIN_TEXTS = 2048
+TOKENIZE_CHUNKSIZE = 64
+# Worker processes per parallel batch; each pays an interpreter start-up, so
+# a few are enough and the API process is not flooded with one per core.
+TOKENIZE_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _tokenize_context():
+    """Start method for tokenizer workers.
+    
+    Not fork: the API process runs thread pools. Workers only import the
+    dependency-free app.utils.tokenizer, so forkserver (or spawn where it
+    is unavailable) starts them cheaply.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _score_postings_numpy(rows, tfs, len_norm, idf, k1, out):
+    """Add one term's BM25 contribution to out[rows]."""
+    out[rows] += idf * (tfs * (k1 + 1)) / (tfs + len_norm[rows])
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _score_postings(rows, tfs, len_norm, idf, k1, out):
+        """Compiled loop form of _score_postings_numpy, without temporaries."""
+        for i in range(rows.size):
+            row = rows[i]
+            tf = tfs[i]
+            out[row] += idf * (tf * (k1 + 1)) / (tf + len_norm[row])
+else:
+    _score_postings = _score_postings_numpy
+
+
+def _intern_terms(term_freq: Counter) -> Counter:
+    """Re-key term frequencies with interned strings.
+    
+    Every chunk's Counter otherwise holds its own copy of each term, so a
+    common word is stored once per chunk containing it; interned, all
+    chunks and the document-frequency table share one string.
+    """
+    intern = sys.intern
+    return Counter({intern(term): tf for term, tf in term_freq.items()})
+
+
+def index_path(collection_name: str) -> Path | None:
+    """Where a collection's BM25 index is persisted; None if bm25_cache_dir is empty."""
+    cache_dir = get_retrieval_settings().bm25_cache_dir
+    return Path(cache_dir) / f"{collection_name}.pkl" if cache_dir else None
+
+
+def index_generation(collection_name: str) -> str:
+    """The collection's current generation token, or "" if none was ever written."""
+    path = index_path(collection_name)
+    if path is None:
+        return ""
+    try:
+        return path.with_suffix(".generation").read_text()
+    except OSError:
+        return ""
+
+
+def bump_index_generation(collection_name: str) -> None:
+    """Record that a collection's points changed, so its saved BM25 index is stale.
+    
+    Writes a fresh random token rather than incrementing a counter, so two
+    processes ingesting at once can never leave the same value behind.
+    """
+    path = index_path(collection_name)
+    if path is None:
+        return
+    token = uuid.uuid4().hex
+    generation_path = path.with_suffix(".generation")
+    tmp_path = generation_path.with_name(f"{generation_path.name}.{token}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(token)
+        tmp_path.replace(generation_path)
+    except OSError:
+        logger.warning("Could not record BM25 index generation at %s", generation_path, exc_info=True)
+
 
 @dataclass
 class KeywordResult:
@@ -33,133 +144,454 @@ class KeywordResult:
 
 
 class BM25Searcher:
-    """BM25 keyword search implementation."""
+    """BM25 keyword search implementation.
+    
+    Safe to share between threads: every public method holds the
+    instance's lock, so a search never sees a half-applied update from
+    add_documents_incremental, remove_document_chunks or rebuild.
+    """
     
     def __init__(self):
         settings = get_retrieval_settings()
         self.k1 = settings.bm25_k1
         self.b = settings.bm25_b
+        # Reentrant: search builds the vocabulary, batches add documents
+        self._lock = threading.RLock()
         
         # Corpus statistics
-        self.documents: dict[str, dict] = {}  # chunk_id -> {text, metadata, term_freq}
+        self.documents: dict[str, dict] = {}  # chunk_id -> {text, term_freq, length, metadata}
         self.term_doc_freq: dict[str, int] = defaultdict(int)  # term -> document frequency
+        self.total_length: int = 0  # running sum of document lengths
         self.avg_doc_length: float = 0.0
         self.total_docs: int = 0
         self.vocab_built: bool = False
+        
+        # Inverted index, appended to by add_document: row i is chunk
+        # _row_ids[i]; each term has growable (rows, term frequencies) arrays.
+        self._row_ids: list[str] = []
+        self._row_lengths = array("d")
+        self._term_rows: dict[str, array] = {}
+        self._term_tfs: dict[str, array] = {}
+        self._dirty_terms: set[str] = set()
+        self._stale_rows: bool = False  # a chunk was replaced; rows need compacting
+        
+        # Search-time view refreshed by build_vocab: NumPy postings for each
+        # term, k1*(1-b+b*len/avg) per row, and IDF cached per queried term.
+        self._len_norm = np.empty(0, dtype=np.float64)
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._idf: dict[str, float] = {}
+        
+        # While a rebuild is scrolling its source, incremental adds and
+        # removals are also logged here and replayed onto the new corpus,
+        # so nothing written mid-scroll is lost. Not reset by clear().
+        self._rebuilds_running: int = 0
+        self._changes_during_rebuild: list[tuple] = []
     
     def _tokenize(self, text: str) -> list[str]:
-        """Simple tokenization - lowercase and split on non-alphanumeric."""
-        return re.findall(r'\b[a-zA-Z0-9]+\b', text.lower())
+        """Simple tokenization - lowercase and split into Unicode word runs."""
+        return tokenize(text)
     
-    def _compute_term_freq(self, tokens: list[str]) -> dict[str, int]:
+    def _compute_term_freq(self, tokens: list[str]) -> Counter:
         """Compute term frequency for a document."""
-        tf = defaultdict(int)
-        for token in tokens:
-            tf[token] += 1
-        return dict(tf)
+        return _intern_terms(Counter(tokens))
     
     def add_document(self, chunk_id: str, text: str, metadata: dict | None = None):
-        """Add a document chunk to the corpus."""
+        """Add a document chunk to the corpus, replacing any chunk with the same id."""
         tokens = self._tokenize(text)
-        term_freq = self._compute_term_freq(tokens)
+        self._add_tokenized(chunk_id, text, metadata, len(tokens), self._compute_term_freq(tokens))
+    
+    def _add_tokenized(self, chunk_id: str, text: str, metadata: dict | None, length: int, term_freq: Counter):
+        """Add a chunk whose text is already tokenized into (length, term_freq)."""
+        with self._lock:
+            if chunk_id in self.documents:
+                self._remove_document(chunk_id)
+            
+            self.documents[chunk_id] = {
+                "text": text,
+                "term_freq": term_freq,
+                "length": length,
+                "metadata": metadata or {}
+            }
+            
+            # Update document frequencies
+            for term in term_freq.keys():
+                self.term_doc_freq[term] += 1
+            self.total_length += length
+            self._index_row(chunk_id, length, term_freq)
+            
+            self.vocab_built = False
+    
+    def _index_row(self, chunk_id: str, length: int, term_freq: dict[str, int]):
+        """Append a chunk as the next row of the inverted index."""
+        row = len(self._row_ids)
+        self._row_ids.append(chunk_id)
+        self._row_lengths.append(length)
+        for term, tf in term_freq.items():
+            rows = self._term_rows.get(term)
+            if rows is None:
+                # Terms loaded from disk only have their mapped posting until
+                # first touched; start the growable copy from it
+                loaded_rows, loaded_tfs = self._postings.get(term, ((), ()))
+                rows = self._term_rows[term] = array("i", loaded_rows)
+                self._term_tfs[term] = array("d", loaded_tfs)
+            rows.append(row)
+            self._term_tfs[term].append(tf)
+        self._dirty_terms.update(term_freq)
+    
+    def _reindex(self):
+        """Rebuild the inverted index rows from self.documents."""
+        self._row_ids = []
+        self._row_lengths = array("d")
+        self._term_rows = {}
+        self._term_tfs = {}
+        self._dirty_terms = set()
+        self._postings = {}
+        for chunk_id, doc in self.documents.items():
+            self._index_row(chunk_id, doc["length"], doc["term_freq"])
+        self._stale_rows = False
+    
+    def add_documents_batch(self, items: list[tuple[str, str, dict]]):
+        """Add (chunk_id, text, metadata) items, tokenizing large batches in parallel.
+        
+        Tokenizing runs before the lock is taken, so searches only wait for
+        the merge into the corpus.
+        """
+        batch_stats = self._tokenize_batch(items)
+        with self._lock:
+            self._merge_batch(items, batch_stats)
+    
+    @staticmethod
+    def _tokenize_batch(items: list[tuple[str, str, dict]]) -> dict[str, tuple[int, Counter]]:
+        """(length, term_freq) per distinct text in items.
         
-        self.documents[chunk_id] = {
-            "text": text,
-            "tokens": tokens,
-            "term_freq": term_freq,
-            "length": len(tokens),
-            "metadata": metadata or {}
+        Each distinct text is tokenized once per batch, so repeated chunks
+        (running headers, re-ingested files) share one counter; the stats
+        are dropped with the batch rather than cached on the index. Texts
+        go to up to TOKENIZE_MAX_WORKERS worker processes when there are at
+        least PARALLEL_TOKENIZE_MIN_TEXTS of them.
+        """
+        texts = list({text: None for _, text, _ in items})
+        if len(texts) >= PARALLEL_TOKENIZE_MIN_TEXTS:
+            # Scoped to the batch so no worker processes outlive it
+            with ProcessPoolExecutor(max_workers=TOKENIZE_MAX_WORKERS, mp_context=_tokenize_context()) as pool:
+                stats = list(pool.map(text_stats, texts, chunksize=TOKENIZE_CHUNKSIZE))
+        else:
+            stats = map(text_stats, texts)
+        return {
+            text: (length, _intern_terms(term_freq))
+            for text, (length, term_freq) in zip(texts, stats)
         }
+    
+    def _merge_batch(self, items: list[tuple[str, str, dict]], batch_stats: dict[str, tuple[int, Counter]]):
+        """Add tokenized items to the corpus; the caller holds the lock."""
+        for chunk_id, text, metadata in items:
+            self._add_tokenized(chunk_id, text, metadata, *batch_stats[text])
+    
+    def add_documents_incremental(self, items: list[tuple[str, str, dict]]):
+        """Add (chunk_id, text, metadata) items to a live index.
         
-        # Update document frequencies
-        for term in term_freq.keys():
-            self.term_doc_freq[term] += 1
+        Document frequencies, total length and posting lists are all
+        appended to in place, so the next search only converts the touched
+        terms' postings instead of re-walking the corpus.
+        """
+        batch_stats = self._tokenize_batch(items)
+        with self._lock:
+            self._merge_batch(items, batch_stats)
+            if self._rebuilds_running:
+                self._changes_during_rebuild.append(("add", items, batch_stats))
+        logger.debug("BM25 index: added %d documents incrementally", len(items))
+    
+    def begin_rebuild(self):
+        """Start logging incremental changes for the next rebuild() to replay.
         
+        Call before reading the source the rebuild's items come from; a
+        rebuild that fails before rebuild() must call abort_rebuild().
+        """
+        with self._lock:
+            self._rebuilds_running += 1
+    
+    def abort_rebuild(self):
+        """Stop the logging started by begin_rebuild() without rebuilding."""
+        with self._lock:
+            self._end_rebuild()
+    
+    def rebuild(self, items: list[tuple[str, str, dict]]):
+        """Replace the whole corpus with (chunk_id, text, metadata) items and build the vocabulary.
+        
+        Items are tokenized first; the swap then runs under the lock, so
+        concurrent searches see either the old corpus or the complete new one.
+        Changes logged since begin_rebuild() are replayed onto the new corpus.
+        """
+        try:
+            batch_stats = self._tokenize_batch(items)
+        except BaseException:
+            self.abort_rebuild()
+            raise
+        with self._lock:
+            self.clear()
+            self._merge_batch(items, batch_stats)
+            for change in self._changes_during_rebuild:
+                if change[0] == "add":
+                    self._merge_batch(change[1], change[2])
+                else:
+                    self._remove_chunks_of(change[1])
+            self._end_rebuild()
+            self.build_vocab()
+    
+    def _end_rebuild(self):
+        # Overlapping rebuilds each replay the whole log, which is safe as
+        # adds replace by chunk id; it is dropped once the last one ends.
+        if self._rebuilds_running:
+            self._rebuilds_running -= 1
+        if not self._rebuilds_running:
+            self._changes_during_rebuild = []
+    
+    def remove_document_chunks(self, document_id: str) -> int:
+        """Drop every chunk whose metadata names document_id; returns how many were removed."""
+        with self._lock:
+            removed = self._remove_chunks_of(document_id)
+            if self._rebuilds_running:
+                self._changes_during_rebuild.append(("remove", document_id))
+            return removed
+    
+    def _remove_chunks_of(self, document_id: str) -> int:
+        chunk_ids = [
+            chunk_id
+            for chunk_id, doc in self.documents.items()
+            if doc["metadata"].get("document_id") == document_id
+        ]
+        for chunk_id in chunk_ids:
+            self._remove_document(chunk_id)
+        return len(chunk_ids)
+    
+    def _remove_document(self, chunk_id: str):
+        """Drop a chunk and back its terms out of the corpus counters."""
+        doc = self.documents.pop(chunk_id)
+        for term in doc["term_freq"]:
+            self.term_doc_freq[term] -= 1
+            if not self.term_doc_freq[term]:
+                del self.term_doc_freq[term]
+        self.total_length -= doc["length"]
+        self._stale_rows = True
         self.vocab_built = False
     
     def build_vocab(self):
         """Build corpus statistics after all documents are added."""
-        if not self.documents:
-            return
+        with self._lock:
+            if not self.documents:
+                return
+                
+            self.avg_doc_length = self.total_length / len(self.documents)
+            self.total_docs = len(self.documents)
             
-        total_length = sum(doc["length"] for doc in self.documents.values())
-        self.avg_doc_length = total_length / len(self.documents)
-        self.total_docs = len(self.documents)
-        self.vocab_built = True
-        
-        logger.info("BM25 vocabulary built: %d documents, avg length %.2f", 
-                   self.total_docs, self.avg_doc_length)
+            if self._stale_rows:
+                self._reindex()
+            
+            lengths = np.array(self._row_lengths, dtype=np.float64)
+            self._len_norm = self.k1 * (1 - self.b + self.b * (lengths / self.avg_doc_length))
+            for term in self._dirty_terms:
+                self._postings[term] = (
+                    np.array(self._term_rows[term], dtype=np.int32),
+                    np.array(self._term_tfs[term], dtype=np.float64),
+                )
+            self._dirty_terms.clear()
+            # IDF depends on the corpus size, so cached values are now stale
+            self._idf.clear()
+            if njit is not None:
+                # Compile (or load from cache) now rather than on the first query
+                _score_postings(np.zeros(1, dtype=np.int32), np.ones(1), np.ones(1), 0.0, self.k1, np.zeros(1))
+            self.vocab_built = True
+            
+            logger.info("BM25 vocabulary built: %d documents, avg length %.2f", 
+                       self.total_docs, self.avg_doc_length)
     
     def search(self, query: str, top_k: int = 10) -> list[KeywordResult]:
         """Search documents using BM25 scoring."""
-        if not self.vocab_built:
-            self.build_vocab()
-        
-        if not self.documents:
-            return []
-        
-        query_tokens = self._tokenize(query)
-        if not query_tokens:
-            return []
-        
-        scores = {}
-        
-        for chunk_id, doc in self.documents.items():
-            score = self._bm25_score(query_tokens, doc)
-            if score > 0:
-                scores[chunk_id] = score
-        
-        # Sort by score descending
-        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
-        
-        results = []
-        for chunk_id, score in ranked:
-            doc = self.documents[chunk_id]
-            meta = doc["metadata"]
-            results.append(KeywordResult(
-                chunk_id=chunk_id,
-                chunk_text=doc["text"],
-                score=score,
-                document_id=meta.get("document_id", ""),
-                title=meta.get("title", ""),
-                author=meta.get("author", ""),
-                page=meta.get("page", 0),
-                section=meta.get("section", ""),
-                chunk_index=meta.get("chunk_index", 0),
-                tags=meta.get("tags", [])
-            ))
-        
-        return results
+        with self._lock:
+            if not self.vocab_built:
+                self.build_vocab()
+            
+            if not self.documents:
+                return []
+            
+            query_tokens = self._tokenize(query)
+            if not query_tokens or top_k <= 0:
+                return []
+            
+            scores = self._score_query(query_tokens)
+            
+            # Top-k by score descending without sorting every scored chunk
+            candidates = np.flatnonzero(scores > 0)
+            candidate_scores = scores[candidates]
+            if candidates.size > top_k:
+                # Keep rows at or above the k-th best score, still in row order,
+                # so ties resolve by insertion order as with a stable sort
+                cut = candidates.size - top_k
+                keep = candidate_scores >= np.partition(candidate_scores, cut)[cut]
+                candidates = candidates[keep]
+                candidate_scores = candidate_scores[keep]
+            ranked = candidates[np.argsort(-candidate_scores, kind="stable")[:top_k]]
+            
+            results = []
+            for row in ranked:
+                chunk_id = self._row_ids[row]
+                score = float(scores[row])
+                doc = self.documents[chunk_id]
+                meta = doc["metadata"]
+                results.append(KeywordResult(
+                    chunk_id=chunk_id,
+                    chunk_text=doc["text"],
+                    score=score,
+                    document_id=meta.get("document_id", ""),
+                    title=meta.get("title", ""),
+                    author=meta.get("author", ""),
+                    page=meta.get("page", 0),
+                    section=meta.get("section", ""),
+                    chunk_index=meta.get("chunk_index", 0),
+                    tags=meta.get("tags", [])
+                ))
+            
+            return results
     
-    def _bm25_score(self, query_tokens: list[str], doc: dict) -> float:
-        """Calculate BM25 score for a document given query tokens."""
-        score = 0.0
-        doc_length = doc["length"]
-        term_freq = doc["term_freq"]
+    def _score_query(self, query_tokens: list[str]) -> np.ndarray:
+        """BM25 score of every row, gathered from the query terms' posting lists."""
+        scores = np.zeros(self.total_docs, dtype=np.float64)
         
         for term in query_tokens:
-            if term not in term_freq:
+            posting = self._postings.get(term)
+            if posting is None:
                 continue
+            rows, tfs = posting
             
-            # IDF calculation
-            df = self.term_doc_freq.get(term, 0)
-            if df == 0:
-                continue
+            idf = self._idf.get(term)
+            if idf is None:
+                df = rows.size
+                idf = self._idf[term] = math.log((self.total_docs - df + 0.5) / (df + 0.5) + 1.0)
             
-            idf = math.log((self.total_docs - df + 0.5) / (df + 0.5) + 1.0)
+            # Term frequency component over the documents containing the term
+            _score_postings(rows, tfs, self._len_norm, idf, self.k1, scores)
+        
+        return scores
+    
+    def save(self, path: Path, source_version: str):
+        """Persist the corpus to disk, stamped with a version of the source collection.
+        
+        The pickle at path holds the documents and the term -> posting
+        offsets; the concatenated posting arrays go to .npy files named by a
+        hash of their contents, so load() can memory-map them.
+        """
+        with self._lock:
+            if not self.vocab_built:
+                self.build_vocab()
+            path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Term frequency component
-            tf = term_freq[term]
-            tf_component = (tf * (self.k1 + 1)) / (tf + self.k1 * (1 - self.b + self.b * (doc_length / self.avg_doc_length)))
+            terms = list(self._postings)
+            sizes = np.fromiter((self._postings[t][0].size for t in terms), dtype=np.int64, count=len(terms))
+            offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+            arrays = {
+                "rows": np.concatenate([self._postings[t][0] for t in terms] or [np.empty(0, np.int32)]),
+                "tfs": np.concatenate([self._postings[t][1] for t in terms] or [np.empty(0, np.float64)]),
+            }
+            digest = hashlib.blake2b(digest_size=8)
+            for name in _POSTING_ARRAYS:
+                digest.update(arrays[name].tobytes())
+            postings_key = digest.hexdigest()
+            for name in _POSTING_ARRAYS:
+                array_path = self._posting_path(path, postings_key, name)
+                if not array_path.exists():
+                    tmp_path = array_path.with_name(array_path.name + ".tmp")
+                    with open(tmp_path, "wb") as f:
+                        np.save(f, arrays[name])
+                    tmp_path.replace(array_path)
             
-            score += idf * tf_component
-        
-        return score
+            state = {
+                "version": _INDEX_FORMAT_VERSION,
+                "source_version": source_version,
+                "documents": self.documents,
+                "term_doc_freq": dict(self.term_doc_freq),
+                "row_ids": self._row_ids,
+                "terms": terms,
+                "offsets": offsets,
+                "postings_key": postings_key,
+            }
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+            self._delete_posting_files(path, keep=postings_key)
+    
+    def load(self, path: Path, source_version: str) -> bool:
+        """Load a corpus saved by save(); returns False if it is missing or stale."""
+        with self._lock:
+            try:
+                with open(path, "rb") as f:
+                    state = pickle.load(f)
+            except FileNotFoundError:
+                return False
+            except Exception:
+                logger.warning("Ignoring unreadable BM25 index at %s", path, exc_info=True)
+                return False
+            
+            if state.get("version") != _INDEX_FORMAT_VERSION or state.get("source_version") != source_version:
+                return False
+            
+            try:
+                rows, tfs = (
+                    np.load(self._posting_path(path, state["postings_key"], name), mmap_mode="r")
+                    for name in _POSTING_ARRAYS
+                )
+            except (OSError, ValueError):
+                logger.warning("Ignoring BM25 index at %s with missing posting arrays", path, exc_info=True)
+                return False
+            
+            self.clear()
+            self.documents.update(state["documents"])
+            self.term_doc_freq.update(state["term_doc_freq"])
+            self.total_length = sum(doc["length"] for doc in self.documents.values())
+            self._row_ids = state["row_ids"]
+            self._row_lengths = array("d", (self.documents[chunk_id]["length"] for chunk_id in self._row_ids))
+            offsets = state["offsets"]
+            self._postings = {
+                term: (rows[offsets[i]:offsets[i + 1]], tfs[offsets[i]:offsets[i + 1]])
+                for i, term in enumerate(state["terms"])
+            }
+            self.build_vocab()
+            return True
+    
+    @staticmethod
+    def _posting_path(path: Path, postings_key: str, name: str) -> Path:
+        return path.with_name(f"{path.stem}.{postings_key}.{name}.npy")
+    
+    @staticmethod
+    def _delete_posting_files(path: Path, keep: str | None = None):
+        for array_path in path.parent.glob(f"{path.stem}.*.npy"):
+            # <stem>.<postings_key>.<name>.npy
+            parts = array_path.name[len(path.stem) + 1:].split(".")
+            if len(parts) == 3 and parts[0] != keep:
+                array_path.unlink(missing_ok=True)
+    
+    @classmethod
+    def delete_saved(cls, path: Path):
+        """Remove an index written by save()."""
+        path.unlink(missing_ok=True)
+        cls._delete_posting_files(path)
     
     def clear(self):
         """Clear all indexed documents."""
-        self.documents.clear()
-        self.term_doc_freq.clear()
-        self.avg_doc_length = 0.0
-        self.total_docs = 0
-        self.vocab_built = False
+        with self._lock:
+            self.documents.clear()
+            self.term_doc_freq.clear()
+            self.total_length = 0
+            self.avg_doc_length = 0.0
+            self.total_docs = 0
+            self.vocab_built = False
+            self._row_ids = []
+            self._row_lengths = array("d")
+            self._term_rows = {}
+            self._term_tfs = {}
+            self._dirty_terms = set()
+            self._stale_rows = False
+            self._len_norm = np.empty(0, dtype=np.float64)
+            self._postings = {}
+            self._idf = {}
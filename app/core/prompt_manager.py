@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from app.utils.text_chunker import Chunk
 
 
@@ -28,6 +31,13 @@ Original query: {query}
 Improved search query:"""
 
 
+@lru_cache(maxsize=4096)
+def _source_header(title: str, page: int | str, section: str) -> str:
+    if section:
+        return f"[Source: {title}, Page {page}, Section: {section}]"
+    return f"[Source: {title}, Page {page}]"
+
+
 class PromptManager:
     """Manages structured prompt templates for RAG, search, and citations."""
 
@@ -45,6 +55,11 @@ class PromptManager:
         context = self._format_context(chunks)
         return self._templates["rag_user"].format(context=context, query=query)
 
+    def format_rag_prompt_from_payloads(self, query: str, payloads: Iterable[dict]) -> str:
+        """format_rag_prompt for raw Qdrant payloads, skipping the Chunk conversion."""
+        context = self._format_context_from_payloads(payloads)
+        return self._templates["rag_user"].format(context=context, query=query)
+
     def format_search_refinement(self, query: str) -> str:
         return self._templates["search_refinement"].format(query=query)
 
@@ -57,13 +72,15 @@ class PromptManager:
     def _format_context(self, chunks: list[Chunk]) -> str:
         parts: list[str] = []
         for chunk in chunks:
-            meta = chunk.metadata
-            title = meta.get("title", "Unknown")
-            page = meta.get("page", "?")
-            section = meta.get("section", "")
-            header = f"[Source: {title}, Page {page}"
-            if section:
-                header += f", Section: {section}"
-            header += "]"
+            get = chunk.metadata.get
+            header = _source_header(get("title", "Unknown"), get("page", "?"), get("section", ""))
             parts.append(f"{header}\n{chunk.text}")
         return "\n\n---\n\n".join(parts)
+
+    def _format_context_from_payloads(self, payloads: Iterable[dict]) -> str:
+        parts: list[str] = []
+        for payload in payloads:
+            get = payload.get
+            header = _source_header(get("title", "Unknown"), get("page", "?"), get("section", ""))
+            parts.append(f"{header}\n{get('text', '')}")
+        return "\n\n---\n\n".join(parts)
@@ -0,0 +1,76 @@
+"""Query-side Qdrant helpers shared by the ingestor and the retrievers.
+
+Kept apart from document_ingestor so searching never imports the PDF
+parser and OCR stack.
+"""
+
+from __future__ import annotations
+
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PayloadSelectorInclude,
+    QuantizationSearchParams,
+    Range,
+    SearchParams,
+)
+
+from app.models.common import MetadataFilter
+
+# Search params for dense queries; Qdrant ignores them on unquantized collections
+QUANTIZED_SEARCH_PARAMS = SearchParams(
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0),
+)
+
+# Payload fields a SearchResult is built from; searches fetch only these
+# instead of every stored payload key.
+SEARCH_RESULT_PAYLOAD = PayloadSelectorInclude(
+    include=["text", "document_id", "title", "author", "page", "section", "chunk_index", "tags"]
+)
+
+
+def _match_value(f: MetadataFilter) -> FieldCondition:
+    return FieldCondition(key=f.field, match=MatchValue(value=f.value))
+
+
+def _match_not_value(f: MetadataFilter) -> Filter:
+    # Nested so "ne" can sit in the outer must list with the other conditions
+    return Filter(must_not=[_match_value(f)])
+
+
+def _match_any(f: MetadataFilter) -> FieldCondition | None:
+    if not isinstance(f.value, list):
+        return None
+    return FieldCondition(key=f.field, match=MatchAny(any=f.value))
+
+
+def _match_range(f: MetadataFilter) -> FieldCondition:
+    return FieldCondition(key=f.field, range=Range(**{f.operator: f.value}))
+
+
+# MetadataFilter.operator -> condition builder; builders return None for a
+# filter they cannot express, which is then skipped
+_FILTER_BUILDERS = {
+    "eq": _match_value,
+    "ne": _match_not_value,
+    "in": _match_any,
+    "gt": _match_range,
+    "gte": _match_range,
+    "lt": _match_range,
+    "lte": _match_range,
+}
+
+
+def build_qdrant_filter(filters: list[MetadataFilter] | None) -> Filter | None:
+    """Translate metadata filters into a Qdrant Filter, or None if none apply."""
+    if not filters:
+        return None
+    conditions = [
+        condition
+        for f in filters
+        if (builder := _FILTER_BUILDERS.get(f.operator)) and (condition := builder(f)) is not None
+    ]
+    # The conditions themselves are validated; the wrapper needs no second pass
+    return Filter.model_construct(must=conditions) if conditions else None
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue, Range
+from qdrant_client.models import Filter, QueryRequest, ScoredPoint
 
 from app.core.embedding_service import EmbeddingService
 from app.core.llm_service import LLMResponse, LLMService
 from app.core.prompt_manager import PromptManager
+from app.core.qdrant_utils import QUANTIZED_SEARCH_PARAMS, SEARCH_RESULT_PAYLOAD, build_qdrant_filter
 from app.models.chat import ChatResponse, Citation, TokenUsage
 from app.models.common import MetadataFilter
 from app.models.search import SearchResponse, SearchResult
@@ -45,30 +47,85 @@ class RAGPipeline:
             query=query_vector,
             query_filter=qdrant_filter,
             limit=top_k,
-            with_payload=True,
+            search_params=QUANTIZED_SEARCH_PARAMS,
+            with_payload=SEARCH_RESULT_PAYLOAD,
         ).points
 
-        search_results = [
-            SearchResult(
-                chunk_text=r.payload.get("text", ""),
-                score=r.score,
-                document_id=r.payload.get("document_id", ""),
-                title=r.payload.get("title", ""),
-                author=r.payload.get("author", ""),
-                page=r.payload.get("page", 0),
-                section=r.payload.get("section", ""),
-                chunk_index=r.payload.get("chunk_index", 0),
-                tags=r.payload.get("tags", []),
-            )
-            for r in results
-        ]
+        search_results = [self._point_to_result(r) for r in results]
+
+        return self._search_response(query, search_results)
+
+    async def asearch(
+        self, query: str, top_k: int = 5, filters: list[MetadataFilter] | None = None
+    ) -> SearchResponse:
+        points = await self._aquery_points(query, top_k, filters)
+        search_results = [self._point_to_result(r) for r in points]
+        return self._search_response(query, search_results)
+
+    async def _aquery_points(
+        self, query: str, top_k: int, filters: list[MetadataFilter] | None
+    ) -> list[ScoredPoint]:
+        # Embedding and the Qdrant call run on worker threads so the event loop stays free
+        query_vector = await self._embedding.aembed_text(query)
+        qdrant_filter = self._build_filter(filters) if filters else None
+
+        response = await asyncio.to_thread(
+            self._qdrant.query_points,
+            collection_name=self._collection,
+            query=query_vector,
+            query_filter=qdrant_filter,
+            limit=top_k,
+            search_params=QUANTIZED_SEARCH_PARAMS,
+            with_payload=SEARCH_RESULT_PAYLOAD,
+        )
+        return response.points
+
+    def search_batch(
+        self, queries: list[str], top_k: int = 5, filters: list[MetadataFilter] | None = None
+    ) -> list[SearchResponse]:
+        """Search several queries with one embedding batch and one Qdrant round-trip."""
+        if not queries:
+            return []
+        query_vectors = self._embedding.embed_batch(queries)
+        qdrant_filter = self._build_filter(filters) if filters else None
+
+        responses = self._qdrant.query_batch_points(
+            collection_name=self._collection,
+            requests=[
+                QueryRequest(
+                    query=vector,
+                    filter=qdrant_filter,
+                    limit=top_k,
+                    params=QUANTIZED_SEARCH_PARAMS,
+                    with_payload=SEARCH_RESULT_PAYLOAD,
+                )
+                for vector in query_vectors
+            ],
+        )
 
-        return SearchResponse(results=search_results, total_count=len(search_results), query=query)
+        batch = []
+        for query, response in zip(queries, responses):
+            search_results = [self._point_to_result(r) for r in response.points]
+            batch.append(self._search_response(query, search_results))
+        return batch
+
+    async def asearch_batch(
+        self, queries: list[str], top_k: int = 5, filters: list[MetadataFilter] | None = None
+    ) -> list[SearchResponse]:
+        return await asyncio.to_thread(self.search_batch, queries, top_k, filters)
 
     def retrieve(
         self, query: str, top_k: int = 5, filters: list[MetadataFilter] | None = None
     ) -> list[Chunk]:
-        response = self.search(query, top_k, filters)
+        return self._to_chunks(self.search(query, top_k, filters))
+
+    async def aretrieve(
+        self, query: str, top_k: int = 5, filters: list[MetadataFilter] | None = None
+    ) -> list[Chunk]:
+        return self._to_chunks(await self.asearch(query, top_k, filters))
+
+    @staticmethod
+    def _to_chunks(response: SearchResponse) -> list[Chunk]:
         return [
             Chunk(
                 text=r.chunk_text,
@@ -91,16 +148,7 @@ class RAGPipeline:
 
         llm_response: LLMResponse = self._llm.generate(user_prompt, system_prompt)
 
-        citations = [
-            Citation(
-                index=i + 1,
-                document_title=c.metadata.get("title", "Unknown"),
-                page=c.metadata.get("page", 0),
-                section=c.metadata.get("section", ""),
-                chunk_text=c.text[:200],
-            )
-            for i, c in enumerate(context_chunks)
-        ]
+        citations = self._citations(context_chunks)
 
         return ChatResponse(
             answer=llm_response.content,
@@ -126,27 +174,18 @@ class RAGPipeline:
     async def arag(
         self, query: str, top_k: int = 5, filters: list[MetadataFilter] | None = None
     ) -> ChatResponse:
-        chunks = self.retrieve(query, top_k, filters)
-        if not chunks:
+        payloads = [p.payload for p in await self._aquery_points(query, top_k, filters)]
+        if not payloads:
             return ChatResponse(
                 answer="I don't have enough information in the provided documents to answer this question.",
                 citations=[],
             )
 
         system_prompt = self._prompt.get_system_prompt()
-        user_prompt = self._prompt.format_rag_prompt(query, chunks)
+        user_prompt = self._prompt.format_rag_prompt_from_payloads(query, payloads)
         llm_response = await self._llm.agenerate(user_prompt, system_prompt)
 
-        citations = [
-            Citation(
-                index=i + 1,
-                document_title=c.metadata.get("title", "Unknown"),
-                page=c.metadata.get("page", 0),
-                section=c.metadata.get("section", ""),
-                chunk_text=c.text[:200],
-            )
-            for i, c in enumerate(chunks)
-        ]
+        citations = self._payload_citations(payloads)
 
         return ChatResponse(
             answer=llm_response.content,
@@ -161,8 +200,9 @@ class RAGPipeline:
     async def arag_stream(
         self, query: str, top_k: int = 5, filters: list[MetadataFilter] | None = None
     ):
-        chunks = self.retrieve(query, top_k, filters)
-        if not chunks:
+        # Payloads go straight into the prompt and citations; no SearchResult/Chunk copies
+        payloads = [p.payload for p in await self._aquery_points(query, top_k, filters)]
+        if not payloads:
             yield {
                 "delta": "I don't have enough information in the provided documents to answer this question.",
                 "citations": [],
@@ -171,10 +211,20 @@ class RAGPipeline:
             return
 
         system_prompt = self._prompt.get_system_prompt()
-        user_prompt = self._prompt.format_rag_prompt(query, chunks)
+        user_prompt = self._prompt.format_rag_prompt_from_payloads(query, payloads)
+
+        citations = self._payload_citations(payloads)
 
-        citations = [
-            Citation(
+        async for token in self._llm.astream(user_prompt, system_prompt):
+            yield {"delta": token, "citations": None, "done": False}
+
+        yield {"delta": "", "citations": citations, "done": True}
+
+    @staticmethod
+    def _citations(chunks: list[Chunk]) -> list[Citation]:
+        # Built from our own chunks, so skip pydantic validation
+        return [
+            Citation.model_construct(
                 index=i + 1,
                 document_title=c.metadata.get("title", "Unknown"),
                 page=c.metadata.get("page", 0),
@@ -184,19 +234,40 @@ class RAGPipeline:
             for i, c in enumerate(chunks)
         ]
 
-        async for token in self._llm.astream(user_prompt, system_prompt):
-            yield {"delta": token, "citations": None, "done": False}
+    @staticmethod
+    def _payload_citations(payloads: list[dict]) -> list[Citation]:
+        return [
+            Citation.model_construct(
+                index=i + 1,
+                document_title=p.get("title", "Unknown"),
+                page=p.get("page", 0),
+                section=p.get("section", ""),
+                chunk_text=p.get("text", "")[:200],
+            )
+            for i, p in enumerate(payloads)
+        ]
 
-        yield {"delta": "", "citations": citations, "done": True}
+    @staticmethod
+    def _search_response(query: str, results: list[SearchResult]) -> SearchResponse:
+        # Safe to skip validation: results are SearchResults built by
+        # _point_to_result and query was validated with the SearchRequest.
+        # Never construct request models (external input) this way.
+        return SearchResponse.model_construct(results=results, total_count=len(results), query=query)
+
+    @staticmethod
+    def _point_to_result(r) -> SearchResult:
+        # Trusted Qdrant output, so skip pydantic validation
+        return SearchResult.model_construct(
+            chunk_text=r.payload.get("text", ""),
+            score=r.score,
+            document_id=r.payload.get("document_id", ""),
+            title=r.payload.get("title", ""),
+            author=r.payload.get("author", ""),
+            page=r.payload.get("page", 0),
+            section=r.payload.get("section", ""),
+            chunk_index=r.payload.get("chunk_index", 0),
+            tags=r.payload.get("tags", []),
+        )
 
-    def _build_filter(self, filters: list[MetadataFilter]) -> Filter:
-        conditions = []
-        for f in filters:
-            if f.operator == "eq":
-                conditions.append(FieldCondition(key=f.field, match=MatchValue(value=f.value)))
-            elif f.operator == "in" and isinstance(f.value, list):
-                conditions.append(FieldCondition(key=f.field, match=MatchAny(any=f.value)))
-            elif f.operator in ("gt", "gte", "lt", "lte"):
-                range_kwargs = {f.operator: f.value}
-                conditions.append(FieldCondition(key=f.field, range=Range(**range_kwargs)))
-        return Filter(must=conditions) if conditions else None
+    def _build_filter(self, filters: list[MetadataFilter]) -> Filter | None:
+        return build_qdrant_filter(filters)
@@ -28,6 +28,9 @@ class RetrievalSettings(BaseSettings):
     bm25_k1: float = 1.5  # Term frequency saturation
     bm25_b: float = 0.75  # Length normalization
     
+    # Directory for the persisted BM25 index, one file per collection ("" disables)
+    bm25_cache_dir: str = ".bm25_cache"
+    
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
 
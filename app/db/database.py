@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import get_settings
@@ -11,17 +11,43 @@ class Base(DeclarativeBase):
 _engine = None
 _session_factory = None
 
+# Applied to every new SQLite connection. WAL lets readers proceed while a
+# write is in progress, and NORMAL sync is safe under WAL.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def get_engine():
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_engine(
-            settings.database_url,
-            connect_args={"check_same_thread": False}
-            if settings.database_url.startswith("sqlite")
-            else {},
-        )
+        if settings.database_url.startswith("sqlite"):
+            _engine = create_engine(
+                settings.database_url,
+                connect_args={"check_same_thread": False},
+            )
+            event.listen(_engine, "connect", _set_sqlite_pragmas)
+        else:
+            _engine = create_engine(
+                settings.database_url,
+                pool_size=20,
+                max_overflow=40,
+                pool_pre_ping=True,
+            )
     return _engine
 
 
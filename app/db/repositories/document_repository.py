@@ -1,6 +1,7 @@
-import json
 from datetime import datetime
 
+import orjson
+from sqlalchemy import delete, func, update
 from sqlalchemy.orm import Session
 
 from app.db.models import Document
@@ -18,7 +19,7 @@ class DocumentRepository:
             path=metadata.path,
             title=metadata.title,
             author=metadata.author,
-            tags=json.dumps(metadata.tags),
+            tags=orjson.dumps(metadata.tags).decode(),
             status=metadata.status,
             page_count=metadata.page_count,
             uploaded_by=uploaded_by,
@@ -37,27 +38,30 @@ class DocumentRepository:
     def count(self) -> int:
         return self._db.query(Document).count()
 
-    def update_status(self, document_id: str, status: DocumentStatus, chunk_count: int = 0) -> Document | None:
-        doc = self.get_by_id(document_id)
-        if doc:
-            doc.status = status
-            doc.chunk_count = chunk_count
-            if status == DocumentStatus.INDEXED:
-                doc.indexed_at = datetime.utcnow()
-            self._db.commit()
-            self._db.refresh(doc)
-        return doc
+    def list_page(self, offset: int = 0, limit: int = 20) -> tuple[list[Document], int]:
+        """Return a page of documents and the total count from one windowed query."""
+        rows = self._db.query(Document, func.count().over()).offset(offset).limit(limit).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], self.count() if offset else 0
+        return [row[0] for row in rows], rows[0][1]
+
+    def update_status(
+        self, document_id: str, status: DocumentStatus, chunk_count: int = 0, page_count: int | None = None
+    ) -> bool:
+        """Set a document's status in a single UPDATE; returns whether the row exists."""
+        values = {"status": status, "chunk_count": chunk_count}
+        if page_count is not None:
+            values["page_count"] = page_count
+        if status == DocumentStatus.INDEXED:
+            values["indexed_at"] = datetime.utcnow()
+        result = self._db.execute(
+            update(Document).where(Document.document_id == document_id).values(**values)
+        )
+        self._db.commit()
+        return result.rowcount > 0
 
     def delete(self, document_id: str) -> bool:
-        doc = self.get_by_id(document_id)
-        if doc:
-            self._db.delete(doc)
-            self._db.commit()
-            return True
-        return False
-
-    def get_tags(self, doc: Document) -> list[str]:
-        try:
-            return json.loads(doc.tags) if doc.tags else []
-        except (json.JSONDecodeError, TypeError):
-            return []
+        result = self._db.execute(delete(Document).where(Document.document_id == document_id))
+        self._db.commit()
+        return result.rowcount > 0
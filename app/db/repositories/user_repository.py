@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.models import User
@@ -31,6 +32,14 @@ class UserRepository:
     def count(self) -> int:
         return self._db.query(User).count()
 
+    def list_page(self, offset: int = 0, limit: int = 20) -> tuple[list[User], int]:
+        """Return a page of users and the total count from one windowed query."""
+        rows = self._db.query(User, func.count().over()).offset(offset).limit(limit).all()
+        if not rows:
+            # Past the last page there is no row to carry the window total.
+            return [], self.count() if offset else 0
+        return [row[0] for row in rows], rows[0][1]
+
     def update_role(self, user_id: int, role: UserRole) -> User | None:
         user = self.get_by_id(user_id)
         if user:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime
+from typing import NamedTuple
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -12,6 +13,17 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 
+# Direct value -> member lookup; avoids Enum.__call__ on hot auth paths.
+# Members are str subclasses, so a UserRole key resolves to itself too.
+ROLE_BY_VALUE: dict[str, UserRole] = {r.value: r for r in UserRole}
+
+
+class AuthenticatedUser(NamedTuple):
+    """The caller as resolved by auth: just what authorization needs, not a User row."""
+    id: int
+    role: UserRole
+
+
 class UserCreate(BaseModel):
     email: str = Field(..., min_length=3)
     password: str = Field(..., min_length=8)
@@ -63,3 +75,4 @@ class APIKeyPayload(BaseModel):
     user_id: int
     role: UserRole
     key_id: int
+    expires_at: datetime | None = None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -11,6 +11,8 @@ class PaginationParams(BaseModel):
     offset: int = Field(default=0, ge=0)
     limit: int = Field(default=20, ge=1, le=100)
 
+    model_config = {"defer_build": True}
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
@@ -18,18 +20,28 @@ class PaginatedResponse(BaseModel, Generic[T]):
     offset: int
     limit: int
 
+    model_config = {"defer_build": True}
+
 
 class ErrorResponse(BaseModel):
     error_code: str
     message: str
     details: dict | None = None
 
+    model_config = {"defer_build": True}
+
 
 class SuccessResponse(BaseModel):
     message: str
 
+    model_config = {"defer_build": True}
+
 
 class MetadataFilter(BaseModel):
     field: str
-    operator: str = "eq"  # eq, ne, gt, gte, lt, lte, in
-    value: str | int | float | list[str]
+    operator: Literal["eq", "ne", "gt", "gte", "lt", "lte", "in"] = "eq"
+    # Most filters match a string, so try the members in order rather than
+    # scoring every one
+    value: str | int | float | list[str] = Field(union_mode="left_to_right")
+
+    model_config = {"defer_build": True}
@@ -3,7 +3,8 @@ from __future__ import annotations
 import enum
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, field_validator
 
 
 class DocumentStatus(str, enum.Enum):
@@ -34,6 +35,8 @@ class DocumentMetadata(BaseModel):
     version: str = ""  # Document version
     source: str = ""  # Source system or origin
 
+    model_config = {"defer_build": True}
+
 
 class ChunkMetadata(BaseModel):
     document_id: str
@@ -46,6 +49,8 @@ class ChunkMetadata(BaseModel):
     url: str = ""
     chunk_index: int = 0
 
+    model_config = {"defer_build": True}
+
 
 class DocumentUploadRequest(BaseModel):
     title: str | None = None
@@ -53,6 +58,8 @@ class DocumentUploadRequest(BaseModel):
     tags: list[str] = Field(default_factory=list)
     url: str | None = None
 
+    model_config = {"defer_build": True}
+
 
 class DocumentUploadResponse(BaseModel):
     document_id: str
@@ -60,6 +67,8 @@ class DocumentUploadResponse(BaseModel):
     chunk_count: int
     message: str
 
+    model_config = {"defer_build": True}
+
 
 class DocumentListItem(BaseModel):
     document_id: str
@@ -72,4 +81,17 @@ class DocumentListItem(BaseModel):
     chunk_count: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "defer_build": True}
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def _decode_tags(cls, value):
+        # Document rows store tags as a JSON string (or NULL)
+        if value is None:
+            return []
+        if isinstance(value, str):
+            try:
+                return orjson.loads(value) if value else []
+            except orjson.JSONDecodeError:
+                return []
+        return value
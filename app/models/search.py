@@ -13,6 +13,8 @@ class SearchRequest(BaseModel):
     use_hybrid: bool = Field(default=False, description="Enable hybrid search (dense + keyword)")
     fusion_method: str | None = Field(default=None, description="Override fusion method: 'rrf' or 'weighted'")
 
+    model_config = {"defer_build": True}
+
 
 class SearchResult(BaseModel):
     chunk_text: str
@@ -28,6 +30,8 @@ class SearchResult(BaseModel):
     dense_score: float | None = Field(default=None, description="Dense retrieval score")
     keyword_score: float | None = Field(default=None, description="Keyword retrieval score")
 
+    model_config = {"defer_build": True}
+
 
 class SearchResponse(BaseModel):
     results: list[SearchResult]
@@ -37,3 +41,5 @@ class SearchResponse(BaseModel):
     search_method: str = Field(default="dense", description="Search method used: 'dense' or 'hybrid'")
     fusion_method: str | None = Field(default=None, description="Fusion method used for hybrid search")
     debug_info: dict | None = Field(default=None, description="Debug information about retrieval")
+
+    model_config = {"defer_build": True}
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
+import secrets
 import time
-import uuid
 
 import logfire
 
@@ -10,6 +10,13 @@ from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+_LOGFIRE_REQUEST_TEMPLATE = "HTTP {method} {path}"
+_LOGFIRE_RESPONSE_TEMPLATE = "HTTP {method} {path} -> {status_code} ({latency_ms}ms)"
+_LOGFIRE_LLM_TEMPLATE = "LLM call {model}: {total_tokens} tokens ({latency_ms}ms)"
+_LOGFIRE_RETRIEVAL_TEMPLATE = "Retrieval: {num_results} results ({latency_ms}ms)"
+_LOGFIRE_INGESTION_TEMPLATE = "Ingested {document_id}: {chunks} chunks ({latency_ms}ms)"
+_LOGFIRE_ERROR_TEMPLATE = "Error: {error_type}: {error_message}"
+
 
 class ObservabilityManager:
     """Structured logging and monitoring via Logfire."""
@@ -28,37 +35,46 @@ class ObservabilityManager:
         else:
             logger.warning("Logfire token not set; observability will use stdlib logging only")
 
+    def _info_enabled(self) -> bool:
+        """True if an INFO event would reach Logfire or the stdlib logger."""
+        return self._configured or logger.isEnabledFor(logging.INFO)
+
     @staticmethod
     def generate_correlation_id() -> str:
-        return str(uuid.uuid4())
+        # 32 hex chars from one urandom read; same width as a dashless UUID4.
+        return secrets.token_hex(16)
 
     def log_request(self, method: str, path: str, correlation_id: str, user_id: int | None = None) -> None:
-        data = {
-            "event": "http_request",
-            "method": method,
-            "path": path,
-            "correlation_id": correlation_id,
-            "user_id": user_id,
-        }
+        if not self._info_enabled():
+            return
         if self._configured:
-            logfire.info("HTTP {method} {path}", **data)
+            logfire.info(
+                _LOGFIRE_REQUEST_TEMPLATE,
+                event="http_request",
+                method=method,
+                path=path,
+                correlation_id=correlation_id,
+                user_id=user_id,
+            )
         logger.info("request %s %s cid=%s user=%s", method, path, correlation_id, user_id)
 
     def log_response(
         self, method: str, path: str, status_code: int,
         correlation_id: str, latency_ms: float, user_id: int | None = None,
     ) -> None:
-        data = {
-            "event": "http_response",
-            "method": method,
-            "path": path,
-            "status_code": status_code,
-            "correlation_id": correlation_id,
-            "latency_ms": round(latency_ms, 2),
-            "user_id": user_id,
-        }
+        if not self._info_enabled():
+            return
         if self._configured:
-            logfire.info("HTTP {method} {path} -> {status_code} ({latency_ms}ms)", **data)
+            logfire.info(
+                _LOGFIRE_RESPONSE_TEMPLATE,
+                event="http_response",
+                method=method,
+                path=path,
+                status_code=status_code,
+                correlation_id=correlation_id,
+                latency_ms=round(latency_ms, 2),
+                user_id=user_id,
+            )
         logger.info(
             "response %s %s status=%d latency=%.2fms cid=%s",
             method, path, status_code, latency_ms, correlation_id,
@@ -68,18 +84,20 @@ class ObservabilityManager:
         self, model: str, prompt_tokens: int, completion_tokens: int,
         latency_ms: float, correlation_id: str,
     ) -> None:
+        if not self._info_enabled():
+            return
         total = prompt_tokens + completion_tokens
-        data = {
-            "event": "llm_call",
-            "model": model,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "total_tokens": total,
-            "latency_ms": round(latency_ms, 2),
-            "correlation_id": correlation_id,
-        }
         if self._configured:
-            logfire.info("LLM call {model}: {total_tokens} tokens ({latency_ms}ms)", **data)
+            logfire.info(
+                _LOGFIRE_LLM_TEMPLATE,
+                event="llm_call",
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=total,
+                latency_ms=round(latency_ms, 2),
+                correlation_id=correlation_id,
+            )
         logger.info(
             "llm model=%s tokens=%d latency=%.2fms cid=%s",
             model, total, latency_ms, correlation_id,
@@ -88,15 +106,17 @@ class ObservabilityManager:
     def log_retrieval(
         self, query: str, num_results: int, latency_ms: float, correlation_id: str,
     ) -> None:
-        data = {
-            "event": "retrieval",
-            "query": query[:200],
-            "num_results": num_results,
-            "latency_ms": round(latency_ms, 2),
-            "correlation_id": correlation_id,
-        }
+        if not self._info_enabled():
+            return
         if self._configured:
-            logfire.info("Retrieval: {num_results} results ({latency_ms}ms)", **data)
+            logfire.info(
+                _LOGFIRE_RETRIEVAL_TEMPLATE,
+                event="retrieval",
+                query=query[:200],
+                num_results=num_results,
+                latency_ms=round(latency_ms, 2),
+                correlation_id=correlation_id,
+            )
         logger.info(
             "retrieval results=%d latency=%.2fms cid=%s",
             num_results, latency_ms, correlation_id,
@@ -105,28 +125,30 @@ class ObservabilityManager:
     def log_ingestion(
         self, document_id: str, chunks: int, latency_ms: float, correlation_id: str,
     ) -> None:
-        data = {
-            "event": "ingestion",
-            "document_id": document_id,
-            "chunks": chunks,
-            "latency_ms": round(latency_ms, 2),
-            "correlation_id": correlation_id,
-        }
+        if not self._info_enabled():
+            return
         if self._configured:
-            logfire.info("Ingested {document_id}: {chunks} chunks ({latency_ms}ms)", **data)
+            logfire.info(
+                _LOGFIRE_INGESTION_TEMPLATE,
+                event="ingestion",
+                document_id=document_id,
+                chunks=chunks,
+                latency_ms=round(latency_ms, 2),
+                correlation_id=correlation_id,
+            )
         logger.info(
             "ingestion doc=%s chunks=%d latency=%.2fms cid=%s",
             document_id, chunks, latency_ms, correlation_id,
         )
 
     def log_error(self, error: Exception, correlation_id: str, context: dict | None = None) -> None:
-        data = {
-            "event": "error",
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "correlation_id": correlation_id,
-            **(context or {}),
-        }
         if self._configured:
-            logfire.error("Error: {error_type}: {error_message}", **data)
+            data = {
+                "event": "error",
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+                "correlation_id": correlation_id,
+                **(context or {}),
+            }
+            logfire.error(_LOGFIRE_ERROR_TEMPLATE, **data)
         logger.error("error %s: %s cid=%s", type(error).__name__, error, correlation_id)
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import logging
 import secrets
 from datetime import datetime, timedelta
 
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.config import Settings, get_settings
 from app.db.models import APIKey, User
 from app.db.repositories.user_repository import UserRepository
-from app.models.auth import APIKeyPayload, TokenPayload, UserCreate, UserRole
+from app.models.auth import ROLE_BY_VALUE, APIKeyPayload, TokenPayload, UserCreate, UserRole
 
 logger = logging.getLogger(__name__)
 
+# Building a CryptContext parses its scheme config; share one across instances.
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Marks password hashes written by the SHA-256 fallback, so verify_password
+# can route them with a prefix check. Older fallback hashes are bare hex.
+_SHA256_PREFIX = "sha256$"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Claims every access token must carry; enforced inside the single verified decode.
+_JWT_DECODE_OPTIONS = {"require": ["exp", "sub"]}
+
 
 class AuthManager:
     """Handles JWT tokens, API key management, and password hashing."""
@@ -24,7 +36,7 @@ class AuthManager:
         self._settings = settings or get_settings()
         self._db = db
         self._user_repo = UserRepository(db)
-        self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self._pwd_context = _pwd_context
 
     # ---- Password ----
 
@@ -35,14 +47,14 @@ class AuthManager:
             return self._pwd_context.hash(password_bytes)
         except Exception:
             # Fallback to SHA256 for demo
-            import hashlib
-            return hashlib.sha256(password.encode()).hexdigest()
+            return _SHA256_PREFIX + hashlib.sha256(password.encode()).hexdigest()
 
     def verify_password(self, plain: str, hashed: str) -> bool:
-        # Check if it's a SHA256 hash (64 hex characters)
-        if len(hashed) == 64 and all(c in '0123456789abcdef' for c in hashed):
-            import hashlib
-            return hashlib.sha256(plain.encode()).hexdigest() == hashed
+        if hashed.startswith(_SHA256_PREFIX):
+            return self._verify_sha256(plain, hashed[len(_SHA256_PREFIX):])
+        # Unprefixed SHA256 hash (64 hex characters) from before the prefix existed
+        if len(hashed) == 64 and _HEX_DIGITS.issuperset(hashed):
+            return self._verify_sha256(plain, hashed)
         
         # Try bcrypt
         try:
@@ -51,6 +63,10 @@ class AuthManager:
         except Exception:
             return False
 
+    @staticmethod
+    def _verify_sha256(plain: str, hex_digest: str) -> bool:
+        return hmac.compare_digest(hashlib.sha256(plain.encode()).hexdigest(), hex_digest)
+
     # ---- JWT ----
 
     def create_access_token(self, user_id: int, role: UserRole) -> str:
@@ -60,9 +76,14 @@ class AuthManager:
 
     def verify_token(self, token: str) -> TokenPayload | None:
         try:
-            data = jwt.decode(token, self._settings.jwt_secret_key, algorithms=[self._settings.jwt_algorithm])
-            return TokenPayload(sub=data["sub"], role=UserRole(data["role"]), exp=data["exp"])
-        except JWTError as e:
+            data = jwt.decode(
+                token,
+                self._settings.jwt_secret_key,
+                algorithms=[self._settings.jwt_algorithm],
+                options=_JWT_DECODE_OPTIONS,
+            )
+            return TokenPayload(sub=data["sub"], role=ROLE_BY_VALUE[data["role"]], exp=data["exp"])
+        except jwt.PyJWTError as e:
             logger.warning("JWT verification failed: %s", e)
             return None
         except Exception as e:
@@ -89,21 +110,29 @@ class AuthManager:
 
     def verify_api_key(self, raw_key: str) -> APIKeyPayload | None:
         key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
-        api_key = self._db.query(APIKey).filter(
-            APIKey.key_hash == key_hash,
-            APIKey.is_active == True,  # noqa: E712
-        ).first()
-
-        if not api_key:
-            return None
-        if api_key.expires_at and api_key.expires_at < datetime.utcnow():
+        # One round trip for the key and its owner, loading only the columns
+        # needed rather than two full ORM rows.
+        row = (
+            self._db.query(APIKey.id, APIKey.expires_at, User.id, User.role)
+            .join(User, User.id == APIKey.user_id)
+            .filter(
+                APIKey.key_hash == key_hash,
+                APIKey.is_active == True,  # noqa: E712
+                User.is_active == True,  # noqa: E712
+            )
+            .first()
+        )
+        if row is None:
             return None
 
-        user = self._user_repo.get_by_id(api_key.user_id)
-        if not user or not user.is_active:
+        key_id, expires_at, user_id, role = row
+        if expires_at and expires_at < datetime.utcnow():
             return None
 
-        return APIKeyPayload(user_id=user.id, role=UserRole(user.role), key_id=api_key.id)
+        # Every field comes from typed DB columns, so skip re-validation.
+        return APIKeyPayload.model_construct(
+            user_id=user_id, role=ROLE_BY_VALUE[role], key_id=key_id, expires_at=expires_at
+        )
 
     # ---- User Auth ----
 
@@ -22,6 +22,7 @@ class RateLimiter:
         self._limiter = Limiter(
             key_func=get_remote_address,
             default_limits=[self._settings.rate_limit_default],
+            storage_uri=self._settings.rate_limit_storage_uri,
         )
 
     @property
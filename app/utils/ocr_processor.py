@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytesseract
@@ -10,6 +12,10 @@ from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# pytesseract runs each image in its own tesseract subprocess, so plain
+# threads give real parallelism; one per core keeps every core busy.
+OCR_CONCURRENCY = os.cpu_count() or 1
+
 
 class OCRProcessor:
     """Extracts text from images using Tesseract OCR with Arabic + English support."""
@@ -29,7 +35,11 @@ class OCRProcessor:
             return ""
 
     def process_images(self, images: list[Image.Image]) -> list[str]:
-        return [self.process_image(img) for img in images]
+        if len(images) <= 1:
+            return [self.process_image(img) for img in images]
+        with ThreadPoolExecutor(max_workers=min(OCR_CONCURRENCY, len(images))) as pool:
+            # map() yields in submission order, so texts line up with images
+            return list(pool.map(self.process_image, images))
 
     @property
     def language(self) -> str:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import io
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from pypdf import PdfReader
 
-from app.utils.ocr_processor import OCRProcessor
+from app.utils.ocr_processor import OCR_CONCURRENCY, OCRProcessor
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +24,8 @@ class PageContent:
 
 @dataclass
 class ParsedDocument:
-    pages: list[PageContent] = field(default_factory=list)
+    # A list from parse(); a one-shot iterator from parse_lazy()
+    pages: list[PageContent] | Iterator[PageContent] = field(default_factory=list)
     metadata: dict = field(default_factory=dict)
     page_count: int = 0
 
@@ -29,33 +34,85 @@ class PDFParser:
     """Parses PDF files, extracting text and falling back to OCR for image-heavy pages."""
 
     MIN_TEXT_LENGTH = 50  # Threshold to consider a page as image-only
+    # Pages held back while earlier pages are still in OCR; bounds both the
+    # OCR queue and how many pages' image bytes and text are kept
+    OCR_MAX_PENDING = 2 * OCR_CONCURRENCY
 
     def __init__(self, ocr_processor: OCRProcessor | None = None):
         self._ocr = ocr_processor or OCRProcessor()
 
     def parse(self, file_path: str | Path) -> ParsedDocument:
+        parsed = self.parse_lazy(file_path)
+        parsed.pages = list(parsed.pages)
+        return parsed
+
+    def parse_lazy(self, file_path: str | Path) -> ParsedDocument:
+        """Open a PDF and return its metadata with pages parsed one at a time as iterated.
+
+        Only the pages waiting on OCR are held at once, instead of the text
+        of the whole document.
+        """
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"PDF not found: {file_path}")
 
         reader = PdfReader(str(file_path))
-        doc_metadata = self._extract_metadata(reader)
-        pages: list[PageContent] = []
+        return ParsedDocument(
+            pages=self._iter_pages(reader),
+            metadata=self._extract_metadata(reader),
+            page_count=len(reader.pages),
+        )
 
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text() or ""
-            is_ocr = False
+    def iter_pages(self, file_path: str | Path) -> Iterator[PageContent]:
+        return self.parse_lazy(file_path).pages
 
-            if len(text.strip()) < self.MIN_TEXT_LENGTH:
-                ocr_text = self._ocr_page(page)
-                if ocr_text:
-                    text = ocr_text
-                    is_ocr = True
+    def _iter_pages(self, reader: PdfReader) -> Iterator[PageContent]:
+        # (page_number, extracted text, pending OCR or None), in page order
+        pending: deque[tuple[int, str, Future | None]] = deque()
+        ocr_pool: ThreadPoolExecutor | None = None
 
-            if text.strip():
-                pages.append(PageContent(page_number=i + 1, text=text.strip(), is_ocr=is_ocr))
-
-        return ParsedDocument(pages=pages, metadata=doc_metadata, page_count=len(reader.pages))
+        try:
+            for i, page in enumerate(reader.pages):
+                text = page.extract_text() or ""
+                ocr_future = None
+
+                if len(text.strip()) < self.MIN_TEXT_LENGTH:
+                    # Image bytes are read here because the reader is not
+                    # thread-safe; only decoding and Tesseract run in the pool
+                    image_data = self._page_image_data(page)
+                    if image_data:
+                        if ocr_pool is None:
+                            ocr_pool = ThreadPoolExecutor(max_workers=OCR_CONCURRENCY)
+                        ocr_future = ocr_pool.submit(self._ocr_images, image_data)
+
+                pending.append((i + 1, text, ocr_future))
+                # Release pages in order as soon as they are ready, and wait
+                # on the oldest once too many are queued behind OCR
+                while pending and (
+                    pending[0][2] is None or pending[0][2].done() or len(pending) > self.OCR_MAX_PENDING
+                ):
+                    content = self._finish_page(*pending.popleft())
+                    if content is not None:
+                        yield content
+
+            while pending:
+                content = self._finish_page(*pending.popleft())
+                if content is not None:
+                    yield content
+        finally:
+            if ocr_pool is not None:
+                ocr_pool.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _finish_page(page_number: int, text: str, ocr_future: Future | None) -> PageContent | None:
+        is_ocr = False
+        if ocr_future is not None:
+            ocr_text = ocr_future.result()
+            if ocr_text:
+                text = ocr_text
+                is_ocr = True
+        text = text.strip()
+        return PageContent(page_number=page_number, text=text, is_ocr=is_ocr) if text else None
 
     def _extract_metadata(self, reader: PdfReader) -> dict:
         meta = reader.metadata or {}
@@ -66,15 +123,22 @@ class PDFParser:
             "creator": getattr(meta, "creator", "") or "",
         }
 
-    def _ocr_page(self, page) -> str:
+    def _page_image_data(self, page) -> list[bytes]:
+        try:
+            return [image_obj.data for image_obj in page.images]
+        except Exception:
+            logger.debug("Image extraction failed for page", exc_info=True)
+            return []
+
+    def _ocr_images(self, image_data: list[bytes]) -> str:
+        """OCR a page's images in order and return the first non-empty text."""
         try:
             from PIL import Image
-            import io
 
-            for image_obj in page.images:
-                data = image_obj.data
-                image = Image.open(io.BytesIO(data))
-                text = self._ocr.process_image(image)
+            for data in image_data:
+                # Close each image so its decoder buffers are freed right away
+                with Image.open(io.BytesIO(data)) as image:
+                    text = self._ocr.process_image(image)
                 if text:
                     return text
         except Exception:
@@ -1,43 +1,124 @@
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from types import MappingProxyType
 
 from app.config import get_settings
 
+# Tried in order; a piece still too long is split again on the next one
+SEPARATORS = ("\n\n", "\n", ".", "。", "،", " ", "")
+
 
 @dataclass
 class Chunk:
     text: str
     chunk_index: int
-    metadata: dict = field(default_factory=dict)
+    metadata: Mapping = field(default_factory=dict)
+
+
+class RecursiveSplitter:
+    """Recursive character splitter, output-compatible with LangChain's
+    RecursiveCharacterTextSplitter(length_function=len, keep_separator=True).
+
+    Pieces are cut with str.split and merged through a deque, so a long
+    document is not re-scanned with regexes or re-sliced on every merge.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int, separators: tuple[str, ...] = SEPARATORS):
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({chunk_overlap}) than chunk size ({chunk_size}), should be smaller."
+            )
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._separators = separators
+
+    def split_text(self, text: str) -> list[str]:
+        return self._split(text, self._separators)
+
+    def _split(self, text: str, separators: tuple[str, ...]) -> list[str]:
+        separator = separators[-1]
+        remaining: tuple[str, ...] = ()
+        for i, sep in enumerate(separators):
+            if not sep:
+                separator = sep
+                break
+            if sep in text:
+                separator = sep
+                remaining = separators[i + 1:]
+                break
+
+        if separator:
+            # Keep each separator at the start of the piece that follows it
+            head, *rest = text.split(separator)
+            pieces = [head, *(separator + part for part in rest)]
+        else:
+            pieces = list(text)
+
+        chunks: list[str] = []
+        short: list[str] = []
+        for piece in pieces:
+            if not piece:
+                continue
+            if len(piece) < self._chunk_size:
+                short.append(piece)
+                continue
+            if short:
+                chunks.extend(self._merge(short))
+                short = []
+            if remaining:
+                chunks.extend(self._split(piece, remaining))
+            else:
+                chunks.append(piece)
+        if short:
+            chunks.extend(self._merge(short))
+        return chunks
+
+    def _merge(self, pieces: list[str]) -> list[str]:
+        """Greedily pack pieces into chunks, carrying up to chunk_overlap chars forward."""
+        size, overlap = self._chunk_size, self._chunk_overlap
+        merged: list[str] = []
+        window: deque[str] = deque()
+        total = 0
+        for piece in pieces:
+            n = len(piece)
+            if total + n > size and window:
+                chunk = "".join(window).strip()
+                if chunk:
+                    merged.append(chunk)
+                while total > overlap or (total + n > size and total > 0):
+                    total -= len(window.popleft())
+            window.append(piece)
+            total += n
+        chunk = "".join(window).strip()
+        if chunk:
+            merged.append(chunk)
+        return merged
 
 
 class TextChunker:
-    """Splits text into overlapping chunks using LangChain's RecursiveCharacterTextSplitter."""
+    """Splits text into overlapping chunks with a recursive character splitter."""
 
     def __init__(self, chunk_size: int | None = None, chunk_overlap: int | None = None):
         settings = get_settings()
         self._chunk_size = chunk_size or settings.chunk_size
         self._chunk_overlap = chunk_overlap or settings.chunk_overlap
-        self._splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self._chunk_size,
-            chunk_overlap=self._chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ".", "。", "،", " ", ""],
-        )
+        self._splitter = RecursiveSplitter(self._chunk_size, self._chunk_overlap)
 
     def chunk(self, text: str, base_metadata: dict | None = None) -> list[Chunk]:
-        base_metadata = base_metadata or {}
+        # One read-only copy shared by every chunk, as chunk_pages does per
+        # page; callers that change a chunk's metadata assign a new dict
+        base_metadata = MappingProxyType(dict(base_metadata or {}))
         splits = self._splitter.split_text(text)
         return [
-            Chunk(text=s, chunk_index=i, metadata={**base_metadata})
+            Chunk(text=s, chunk_index=i, metadata=base_metadata)
             for i, s in enumerate(splits)
             if s.strip()
         ]
 
-    def chunk_pages(self, pages: list[dict]) -> list[Chunk]:
+    def chunk_pages(self, pages: Iterable[dict]) -> list[Chunk]:
         """Chunk a list of pages, preserving page-level metadata.
 
         Each page dict should have 'text', 'page_number', and optionally other keys.
@@ -46,7 +127,7 @@ class TextChunker:
         idx = 0
         for page in pages:
             text = page.get("text", "")
-            page_meta = {k: v for k, v in page.items() if k != "text"}
+            page_meta = MappingProxyType({k: v for k, v in page.items() if k != "text"})
             splits = self._splitter.split_text(text)
             for s in splits:
                 if s.strip():
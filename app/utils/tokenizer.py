@@ -0,0 +1,23 @@
+"""Word tokenization for the BM25 keyword index.
+
+Imports nothing from the app, so the index's tokenizer worker processes
+start without loading the embedding model or Qdrant client modules.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens of a text."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def text_stats(text: str) -> tuple[int, Counter]:
+    """(token count, term frequencies) of a text."""
+    tokens = tokenize(text)
+    return len(tokens), Counter(tokens)
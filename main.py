@@ -2,15 +2,15 @@ import logging
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from app.api.middleware.correlation import CorrelationMiddleware
-from app.api.middleware.logging import LoggingMiddleware
+from app.api.dependencies import warm_up_singletons
+from app.api.middleware.observability import ObservabilityMiddleware
 from app.api.routes import admin, auth, chat, documents, search
 from app.config import get_settings
 from app.db.database import create_tables
@@ -27,6 +27,7 @@ app = FastAPI(
     title="RAG Semantic Search API",
     description="Retrieval-Augmented Generation API with citations, RBAC, and observability",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # ---- Middleware (order matters: last added = first executed) ----
@@ -37,8 +38,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(LoggingMiddleware, obs=obs)
-app.add_middleware(CorrelationMiddleware)
+app.add_middleware(ObservabilityMiddleware, obs=obs)
 
 # ---- Rate limiting ----
 app.state.limiter = rate_limiter.limiter
@@ -74,6 +74,11 @@ def on_startup():
     logging.getLogger(__name__).info("Database tables created, application ready")
 
 
+@app.on_event("startup")
+async def on_startup_warm_up():
+    await warm_up_singletons()
+
+
 # ---- Health check ----
 @app.get("/health", tags=["Health"])
 def health():
@@ -85,7 +90,7 @@ def health():
 async def global_exception_handler(request: Request, exc: Exception):
     cid = getattr(request.state, "correlation_id", "unknown")
     obs.log_error(exc, cid)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error_code": "INTERNAL_ERROR", "message": "An unexpected error occurred", "details": None},
     )
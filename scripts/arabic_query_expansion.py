@@ -4,10 +4,18 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import re
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; a plain substring scan is the fallback
+    ahocorasick = None
+
+# Trie leaf marker; not a character, so it can't collide with a query's text.
+# Maps to the dictionary key a complete pattern belongs to.
+_TRIE_END = None
 
 @dataclass
 class ExpandedQuery:
@@ -78,14 +86,25 @@ class ArabicQueryExpander:
     }
     
     def __init__(self):
-        self.compiled_patterns = self._compile_patterns()
+        # pattern -> dictionary key. Only keys already in normalized form can
+        # match, as before: the old scan required the key in both the raw and
+        # the normalized query.
+        synonym_keys = [key for key in self.SYNONYMS if _normalize_cached(key) == key]
+        self._synonym_matcher = _build_matcher({key: key for key in synonym_keys})
+        # A query sharing no character with any key's first can't match
+        self._synonym_first_chars = frozenset(key[0] for key in synonym_keys if key)
+        self._mixed_matcher = _build_matcher({
+            pattern: ar_term
+            for ar_term, variants in self.MIXED_TERMS.items()
+            for pattern in (ar_term, *variants)
+        })
     
-    def _compile_patterns(self) -> Dict:
-        """Compile regex patterns for efficiency."""
-        return {
-            'tashkeel': re.compile(f'[{self.TASHKEEL_CHARS}]'),
-            'alef': re.compile('|'.join(self.ALEF_VARIANTS.keys())),
-        }
+    @classmethod
+    def _build_tables(cls) -> Dict[int, Optional[str]]:
+        """Build one str.translate table that drops tashkeel and maps alef variants."""
+        table = str.maketrans(cls.ALEF_VARIANTS)
+        table.update(dict.fromkeys(map(ord, cls.TASHKEEL_CHARS)))
+        return table
     
     def normalize(self, text: str) -> str:
         """
@@ -94,53 +113,39 @@ class ArabicQueryExpander:
         - Normalize alef variants
         - Convert to lowercase for any English
         """
-        # Remove tashkeel
-        text = self.compiled_patterns['tashkeel'].sub('', text)
-        
-        # Normalize alef variants
-        for variant, standard in self.ALEF_VARIANTS.items():
-            text = text.replace(variant, standard)
-        
-        return text.lower().strip()
+        return _normalize_cached(text)
     
     def expand_synonyms(self, query: str) -> List[str]:
         """Generate synonym expansions for query terms."""
-        normalized = self.normalize(query)
-        words = normalized.split()
+        if self._synonym_first_chars.isdisjoint(query):
+            return [query]
         
         expansions = [query]  # Always include original
         
-        for word in words:
-            # Check for multi-word keys first
-            for key, synonyms in self.SYNONYMS.items():
-                if key in normalized or any(s in normalized for s in [key.replace(' ', '')]):
-                    for syn in synonyms:
-                        expanded = query.replace(key, syn) if key in query else query
-                        if expanded != query:
-                            expansions.append(expanded)
-            
-            # Single word synonyms
-            if word in self.SYNONYMS:
-                for syn in self.SYNONYMS[word]:
-                    new_query = query.replace(word, syn)
-                    if new_query != query:
-                        expansions.append(new_query)
+        # One pass over the query finds every key (single- or multi-word)
+        # that a replacement can apply to
+        for key in _matched_keys(self._synonym_matcher, query):
+            for syn in self.SYNONYMS[key]:
+                expanded = query.replace(key, syn)
+                if expanded != query:
+                    expansions.append(expanded)
         
-        return list(set(expansions))  # Remove duplicates
+        return list(dict.fromkeys(expansions))  # Remove duplicates, keep order
     
     def expand_mixed_terms(self, query: str) -> List[str]:
         """Handle mixed Arabic-English terms."""
         expansions = [query]
         normalized = self.normalize(query)
+        query_lower = query.lower()
         
-        for ar_term, variants in self.MIXED_TERMS.items():
-            if ar_term in normalized or any(v in normalized for v in variants):
-                # Add all variants
-                for variant in variants:
-                    if variant not in query.lower():
-                        expansions.append(f"{query} {variant}")
+        # A term matches if it or any of its variants appears
+        for ar_term in _matched_keys(self._mixed_matcher, normalized):
+            # Add all variants
+            for variant in self.MIXED_TERMS[ar_term]:
+                if variant not in query_lower:
+                    expansions.append(f"{query} {variant}")
         
-        return list(set(expansions))
+        return list(dict.fromkeys(expansions))
     
     def add_domain_context(self, query: str, domain: str = 'realsoft') -> str:
         """Add domain-specific context to query."""
@@ -187,14 +192,13 @@ class ArabicQueryExpander:
             if contextualized != query:
                 variations.append(contextualized)
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_variations = []
+        # Keep the first variation per normalized form, in order. The
+        # normalized forms come from the shared cache, so the query and any
+        # repeated variation are not normalized again.
+        by_normalized: Dict[str, str] = {}
         for v in variations:
-            v_norm = self.normalize(v)
-            if v_norm not in seen:
-                seen.add(v_norm)
-                unique_variations.append(v)
+            by_normalized.setdefault(_normalize_cached(v), v)
+        unique_variations = list(by_normalized.values())
         
         # Create expanded query (combine unique terms)
         expanded = ' '.join(unique_variations[:3])  # Limit to avoid too long queries
@@ -207,6 +211,57 @@ class ArabicQueryExpander:
         )
 
 
+# Built once from the class tables. normalize() is memoized on the raw text
+# because expand() normalizes the same query and variations several times.
+_NORMALIZE_TABLE = ArabicQueryExpander._build_tables()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str) -> str:
+    # Single pass over the text for both tashkeel and alef variants
+    return text.translate(_NORMALIZE_TABLE).lower().strip()
+
+
+def _build_matcher(patterns: Dict[str, str]):
+    """
+    Compile pattern -> key into an Aho-Corasick automaton, or into a
+    character trie of nested dicts when pyahocorasick is not installed.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern, key in patterns.items():
+            automaton.add_word(pattern, key)
+        automaton.make_automaton()
+        return automaton
+    
+    trie: Dict = {}
+    for pattern, key in patterns.items():
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[_TRIE_END] = key
+    return trie
+
+
+def _matched_keys(matcher, text: str) -> List[str]:
+    """Keys with at least one pattern occurring in text, each listed once."""
+    if ahocorasick is not None:
+        return list(dict.fromkeys(key for _, key in matcher.iter(text)))
+    
+    # Walk the trie from every start position, stopping at the first
+    # character with no edge; shared prefixes are followed only once
+    found: Dict[str, None] = {}
+    for start in range(len(text)):
+        node = matcher
+        for ch in text[start:]:
+            node = node.get(ch)
+            if node is None:
+                break
+            if _TRIE_END in node:
+                found[node[_TRIE_END]] = None
+    return list(found)
+
+
 class ArabicRetrievalEnhancer:
     """
     Enhances retrieval for Arabic queries by:
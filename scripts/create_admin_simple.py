@@ -1,16 +1,16 @@
-"""Create admin user with simple password hashing (for demo only)."""
+"""Create admin user directly in the database, hashing the password like the API does."""
 
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import hashlib
 from datetime import datetime
 
 from app.db.database import create_tables, get_session_factory
 from app.db.models import User
 from app.models.auth import UserRole
+from app.security.auth_manager import AuthManager
 
 
 def main():
@@ -36,8 +36,8 @@ def main():
             print(f"User '{email}' already exists.")
             return
 
-        # Simple SHA256 hash (for demo only - not secure for production)
-        hashed_password = hashlib.sha256(password.encode()).hexdigest()
+        # Salted bcrypt, or the app's tagged SHA-256 fallback if bcrypt is unavailable
+        hashed_password = AuthManager(db).hash_password(password)
 
         user = User(
             email=email,
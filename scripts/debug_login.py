@@ -6,6 +6,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import hashlib
+import hmac
 
 from app.db.database import get_session_factory
 from app.db.models import User
@@ -30,14 +31,15 @@ def main():
         print(f"  Stored hash: {user.hashed_password}")
         print(f"  Hash length: {len(user.hashed_password)}")
         
-        # Check if SHA256
-        is_sha256 = len(user.hashed_password) == 64 and all(c in '0123456789abcdef' for c in user.hashed_password)
+        # Check if SHA256 (tagged "sha256$" by the fallback, or bare hex from older scripts)
+        stored_hex = user.hashed_password.removeprefix("sha256$")
+        is_sha256 = len(stored_hex) == 64 and all(c in '0123456789abcdef' for c in stored_hex)
         print(f"  Is SHA256: {is_sha256}")
         
         # Calculate SHA256
         calculated_hash = hashlib.sha256(password.encode()).hexdigest()
         print(f"  Calculated:  {calculated_hash}")
-        print(f"  Match: {calculated_hash == user.hashed_password}")
+        print(f"  Match: {is_sha256 and hmac.compare_digest(calculated_hash, stored_hex)}")
         
         # Try AuthManager
         auth = AuthManager(db)
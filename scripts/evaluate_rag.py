@@ -2,6 +2,7 @@
 
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -13,6 +14,8 @@ from app.core.prompt_manager import PromptManager
 from app.core.rag_pipeline import RAGPipeline
 from qdrant_client import QdrantClient
 
+# Questions answered at once; each is dominated by Qdrant and LLM round trips
+EVAL_CONCURRENCY = 8
 
 evaluation_set = [
     {"id": 1, "question": "What is RealSoft's main mission?", "expected_source": "The Content of RealSoft (1).pdf", "expected_page": 7},
@@ -42,6 +45,22 @@ evaluation_set = [
     {"id": 25, "question": "What is SBM company?", "expected_source": "The Content of RealSoft (1).pdf", "expected_page": 11},
 ]
 
+# Expected (source, page) per question id, with the source normalized once
+EXPECTED_BY_ID = {
+    it['id']: (it['expected_source'].lower().strip(), it['expected_page'])
+    for it in evaluation_set
+}
+
+
+def source_matches(expected_norm: str, retrieved_source: str) -> bool:
+    """Whether a retrieved title and a normalized expected source name the same file.
+    
+    Either may contain the other (titles are usually the file stem), so the
+    retrieved title is normalized once and then checked both ways.
+    """
+    retrieved_norm = retrieved_source.lower().strip()
+    return expected_norm in retrieved_norm or retrieved_norm in expected_norm
+
 
 def main():
     settings = get_settings()
@@ -67,12 +86,14 @@ def main():
     
     print(f"\nRunning evaluation on {len(evaluation_set)} questions...\n")
     
-    for item in evaluation_set:
+    with ThreadPoolExecutor(max_workers=EVAL_CONCURRENCY) as pool:
+        # Get RAG responses concurrently; report them in question order
+        futures = [pool.submit(pipeline.rag, item['question'], top_k=5) for item in evaluation_set]
+        responses = [future.result() for future in futures]
+    
+    for item, response in zip(evaluation_set, responses):
         print(f"Q{item['id']}: {item['question']}")
         
-        # Get RAG response
-        response = pipeline.rag(item['question'], top_k=5)
-        
         # Check if we got citations
         has_citations = len(response.citations) > 0
         if has_citations:
@@ -81,9 +102,10 @@ def main():
             retrieved_source = first_citation.document_title
             retrieved_page = first_citation.page
             
-            # Check if source matches
-            source_match = item['expected_source'] in retrieved_source or retrieved_source in item['expected_source']
-            page_match = retrieved_page == item['expected_page']
+            # Check if source matches, ignoring case and surrounding whitespace
+            expected_source, expected_page = EXPECTED_BY_ID[item['id']]
+            source_match = source_matches(expected_source, retrieved_source)
+            page_match = retrieved_page == expected_page
             
             if source_match:
                 correct_source += 1
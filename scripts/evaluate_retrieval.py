@@ -78,11 +78,6 @@ class RetrievalEvaluator:
                 qdrant_client=self.qdrant_client,
                 collection_name=self.settings.qdrant_collection,
             )
-            # Override fusion method if specified
-            if fusion_method:
-                from app.core.retrieval_config import get_retrieval_settings
-                retrieval_settings = get_retrieval_settings()
-                retrieval_settings.fusion_method = fusion_method
         else:
             # Standard dense retrieval via RAGPipeline
             llm_service = LLMService()
@@ -103,7 +98,9 @@ class RetrievalEvaluator:
         
         # Perform search
         if self.use_hybrid:
-            results, debug_info = self.retriever.search(query, use_cache=True)
+            results, debug_info = self.retriever.search(
+                query, use_cache=True, fusion_method=self.fusion_method
+            )
             search_method = "hybrid"
             fusion = debug_info.get("fusion_method")
         else:
@@ -49,7 +49,9 @@ class RerankerEvaluator:
         
         # Get base results
         if self.base_retriever.use_hybrid:
-            results, _ = self.base_retriever.retriever.search(query, use_cache=True)
+            results, _ = self.base_retriever.retriever.search(
+                query, use_cache=True, fusion_method=self.base_retriever.fusion_method
+            )
         else:
             response = self.base_retriever.pipeline.search(query, top_k=10)
             results = response.results
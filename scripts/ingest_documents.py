@@ -11,6 +11,7 @@ from qdrant_client import QdrantClient
 from app.config import get_settings
 from app.core.document_ingestor import DocumentIngestor
 from app.core.embedding_service import EmbeddingService
+from app.core.hybrid_retrieval import HybridRetriever
 from app.db.database import create_tables, get_session_factory
 from app.db.repositories.document_repository import DocumentRepository
 from app.models.documents import DocumentMetadata
@@ -41,11 +42,24 @@ def main():
 
     print("Loading embedding model (this may take a moment)...")
     embedding = EmbeddingService()
-    qdrant = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
+    qdrant = QdrantClient(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        grpc_port=settings.qdrant_grpc_port,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+    )
+    # Ingests update the retriever's BM25 index in place, so the saved copy
+    # stays current without a full rebuild on the next search
+    retriever = HybridRetriever(
+        embedding_service=embedding,
+        qdrant_client=qdrant,
+        collection_name=settings.qdrant_collection,
+    )
     ingestor = DocumentIngestor(
         embedding_service=embedding,
         qdrant_client=qdrant,
         collection_name=settings.qdrant_collection,
+        keyword_index=retriever.keyword_index,
     )
 
     factory = get_session_factory()
@@ -53,17 +67,23 @@ def main():
     doc_repo = DocumentRepository(db)
 
     try:
-        for file_path in files:
-            doc_id = str(uuid.uuid4())
-            print(f"\nIngesting: {file_path.name} (id={doc_id})")
-
-            metadata = DocumentMetadata(
-                document_id=doc_id,
-                title=file_path.stem,
-                path=str(file_path),
+        items = [
+            (
+                file_path,
+                DocumentMetadata(
+                    document_id=str(uuid.uuid4()),
+                    title=file_path.stem,
+                    path=str(file_path),
+                ),
             )
+            for file_path in files
+        ]
+        print(f"\nIngesting {len(items)} file(s)...")
+        results = ingestor.ingest_many(items)
 
-            result = ingestor.ingest(file_path, metadata)
+        for (file_path, metadata), result in zip(items, results):
+            doc_id = metadata.document_id
+            print(f"\n{file_path.name} (id={doc_id})")
 
             doc_repo.create(metadata, file_path.name)
             doc_repo.update_status(doc_id, result.status, result.chunk_count)
@@ -76,6 +96,7 @@ def main():
     finally:
         db.close()
 
+    retriever.save_keyword_index()
     print("\nIngestion complete.")
 
 
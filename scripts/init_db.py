@@ -22,6 +22,8 @@ def main():
         from qdrant_client import QdrantClient
         from qdrant_client.models import Distance, VectorParams
 
+        from app.core.document_ingestor import VECTOR_QUANTIZATION, ensure_payload_indexes
+
         client = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
         collections = [c.name for c in client.get_collections().collections]
 
@@ -33,10 +35,13 @@ def main():
             client.create_collection(
                 collection_name=settings.qdrant_collection,
                 vectors_config=VectorParams(size=dimension, distance=Distance.COSINE),
+                quantization_config=VECTOR_QUANTIZATION,
             )
             print(f"Created Qdrant collection: {settings.qdrant_collection} (dim={dimension})")
         else:
             print(f"Qdrant collection '{settings.qdrant_collection}' already exists.")
+        ensure_payload_indexes(client, settings.qdrant_collection)
+        print("Payload indexes ensured.")
     except Exception as e:
         print(f"Warning: Could not connect to Qdrant ({e}). Start Qdrant and retry.")
 
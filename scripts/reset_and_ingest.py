@@ -11,6 +11,7 @@ from qdrant_client import QdrantClient
 from app.config import get_settings
 from app.core.document_ingestor import DocumentIngestor
 from app.core.embedding_service import EmbeddingService
+from app.core.hybrid_retrieval import HybridRetriever
 from app.db.database import create_tables, get_session_factory
 from app.db.repositories.document_repository import DocumentRepository
 from app.models.documents import DocumentMetadata
@@ -34,7 +35,12 @@ def main():
 
     # Delete existing collection
     print("Deleting existing Qdrant collection...")
-    qdrant = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
+    qdrant = QdrantClient(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        grpc_port=settings.qdrant_grpc_port,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+    )
     try:
         qdrant.delete_collection(settings.qdrant_collection)
         print(f"Deleted collection: {settings.qdrant_collection}")
@@ -43,30 +49,45 @@ def main():
 
     print("Loading embedding model (this may take a moment)...")
     embedding = EmbeddingService()
+    retriever = HybridRetriever(
+        embedding_service=embedding,
+        qdrant_client=qdrant,
+        collection_name=settings.qdrant_collection,
+    )
     ingestor = DocumentIngestor(
         embedding_service=embedding,
         qdrant_client=qdrant,
         collection_name=settings.qdrant_collection,
+        keyword_index=retriever.keyword_index,
     )
+    # Start the BM25 index from the fresh, empty collection; ingests then
+    # keep it current
+    retriever.rebuild_keyword_index()
 
     factory = get_session_factory()
     db = factory()
     doc_repo = DocumentRepository(db)
 
     try:
-        for file_path in files:
-            doc_id = str(uuid.uuid4())
-            print(f"\nIngesting: {file_path.name} (id={doc_id})")
-
-            metadata = DocumentMetadata(
-                document_id=doc_id,
-                title=file_path.stem,
-                path=str(file_path),
-                url=f"file://{file_path.name}",  # Add source URL
-                category="document",  # Add category
+        items = [
+            (
+                file_path,
+                DocumentMetadata(
+                    document_id=str(uuid.uuid4()),
+                    title=file_path.stem,
+                    path=str(file_path),
+                    url=f"file://{file_path.name}",  # Add source URL
+                    category="document",  # Add category
+                ),
             )
+            for file_path in files
+        ]
+        print(f"\nIngesting {len(items)} file(s)...")
+        results = ingestor.ingest_many(items)
 
-            result = ingestor.ingest(file_path, metadata)
+        for (file_path, metadata), result in zip(items, results):
+            doc_id = metadata.document_id
+            print(f"\n{file_path.name} (id={doc_id})")
 
             doc_repo.create(metadata, file_path.name)
             doc_repo.update_status(doc_id, result.status, result.chunk_count)
@@ -80,6 +101,7 @@ def main():
     finally:
         db.close()
 
+    retriever.save_keyword_index()
     print("\nIngestion complete.")
 
 